@@ -0,0 +1,5 @@
+"""
+Benchmarks for django-entangled. Run them from the root of the repository using::
+
+    python -m benchmarks [--fields 10 100 1000] [--filter NAME] [--repeat 5]
+"""
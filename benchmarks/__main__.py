@@ -0,0 +1,59 @@
+import argparse
+import importlib
+import os
+import pkgutil
+import sys
+
+import django
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    django.setup()
+
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+
+    from tests.models import Category
+
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    get_user_model().objects.bulk_create([get_user_model()(username=name) for name in ('John', 'Mary')])
+    Category.objects.bulk_create([Category(identifier=name) for name in ('Paraphernalia', 'Detergents')])
+
+
+def collect_benchmarks(name_filter):
+    package = os.path.dirname(__file__)
+    for module_info in sorted(pkgutil.iter_modules([package]), key=lambda info: info.name):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module('benchmarks.' + module_info.name)
+        for name, func in vars(module).items():
+            if name.startswith('bench_') and callable(func) and (not name_filter or name_filter in name):
+                yield name[len('bench_'):], func
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description="Runs the benchmarks of django-entangled.",
+    )
+    parser.add_argument('--fields', nargs='+', type=int, default=[10, 100, 1000], help="Field counts to benchmark.")
+    parser.add_argument('--filter', help="Only run benchmarks containing this string in their name.")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timing rounds per benchmark.")
+    options = parser.parse_args(argv)
+
+    setup()
+    from django.db import transaction
+
+    from .harness import HEADER, measure
+
+    print(HEADER)
+    for name, factory in collect_benchmarks(options.filter):
+        for field_count in options.fields:
+            # each benchmark runs inside a transaction which is rolled back afterwards
+            with transaction.atomic():
+                print(measure(name, field_count, factory(field_count), repeat=options.repeat), flush=True)
+                transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
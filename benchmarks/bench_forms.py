@@ -0,0 +1,59 @@
+"""
+Costs of constructing entangled forms and of packing their cleaned data into JSON fields.
+"""
+from .factories import make_data, make_form_class
+from entangled.schema import EntangledValidator
+from tests.models import Product
+
+
+def bench_construction_unbound(field_count):
+    form_class = make_form_class(field_count)
+    return lambda: form_class()
+
+
+def bench_construction_shared_fields(field_count):
+    form_class = make_form_class(field_count, entangled_shared_fields=True)
+    return lambda: form_class()
+
+
+def bench_construction_with_instance(field_count):
+    form_class = make_form_class(field_count, depth=3)
+    form = form_class(data=make_data(form_class))
+    form.is_valid()
+    instance = form.save()
+    instance = Product.objects.get(pk=instance.pk)
+    return lambda: form_class(instance=instance)
+
+
+def _clean_form(form_class):
+    form = form_class(data=make_data(form_class))
+    form.full_clean()
+    cleaned_fields = {name: form.cleaned_data.get(name) for name in form.fields}
+
+    def clean_form():
+        form.instance.properties = {}
+        form.cleaned_data = dict(cleaned_fields)
+        form._clean_form()
+
+    return clean_form
+
+
+def bench_clean_form_flat(field_count):
+    return _clean_form(make_form_class(field_count))
+
+
+def bench_clean_form_nested(field_count):
+    return _clean_form(make_form_class(field_count, depth=5))
+
+
+def bench_full_clean(field_count):
+    form_class = make_form_class(field_count, depth=3)
+    data = make_data(form_class)
+    return lambda: form_class(data=data).is_valid()
+
+
+def bench_validator(field_count):
+    form_class = make_form_class(field_count, depth=3)
+    validator = EntangledValidator(form_class)
+    data = make_data(form_class)
+    return lambda: validator.validate(data)
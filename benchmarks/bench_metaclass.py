@@ -0,0 +1,16 @@
+"""
+Costs of creating entangled form classes.
+"""
+from .factories import make_form_class, make_inherited_form_class
+
+
+def bench_class_creation_flat(field_count):
+    return lambda: make_form_class(field_count)
+
+
+def bench_class_creation_nested(field_count):
+    return lambda: make_form_class(field_count, depth=5)
+
+
+def bench_class_creation_inherited(field_count):
+    return lambda: make_inherited_form_class(field_count, levels=10)
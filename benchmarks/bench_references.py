@@ -0,0 +1,20 @@
+"""
+Costs of resolving the objects referenced by model choice fields. The number of queries must not
+depend on the number of fields.
+"""
+from .factories import make_reference_form_class, make_reference_instance
+from tests.models import Product
+
+
+def bench_reference_hydration(field_count):
+    form_class = make_reference_form_class(field_count)
+    instance = make_reference_instance(form_class)
+    return lambda: form_class(instance=instance)
+
+
+def bench_reference_prefetch(field_count):
+    form_class = make_reference_form_class(10)
+    for _ in range(field_count):
+        make_reference_instance(form_class)
+    instances = list(Product.objects.all()[:field_count])
+    return lambda: form_class.prefetch_related_objects(instances)
@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from django.forms import fields
+from django.forms.models import ModelChoiceField, ModelMultipleChoiceField
+
+from entangled.forms import EntangledModelForm
+from tests.models import Category, Product
+
+
+def field_names(field_count, prefix="field"):
+    return ["{}_{}".format(prefix, index) for index in range(field_count)]
+
+
+def nested_path(name, depth):
+    return ".".join(["level_{}".format(level) for level in range(depth)] + [name])
+
+
+def make_form_class(field_count, depth=0, bases=(EntangledModelForm,), prefix="field", **options):
+    """
+    Creates an entangled form for model `Product` with `field_count` character fields, which are
+    stored `depth` levels deep inside its JSON field. Additional Meta-options can be passed as keywords.
+    """
+    names = field_names(field_count, prefix)
+    meta_attrs = dict(options, **{
+        'model': Product,
+        'untangled_fields': ['name'],
+        'entangled_fields': {'properties': names},
+    })
+    if depth:
+        meta_attrs['retangled_fields'] = {name: nested_path(name, depth) for name in names}
+    attrs = {name: fields.CharField() for name in names}
+    attrs['Meta'] = type('Meta', (), meta_attrs)
+    return type('Form{}x{}'.format(field_count, depth), bases, attrs)
+
+
+def make_inherited_form_class(field_count, levels=10):
+    """
+    Creates a chain of `levels` entangled forms, each inheriting from its predecessor and adding
+    its share of `field_count` fields.
+    """
+    form_class = EntangledModelForm
+    per_level = max(field_count // levels, 1)
+    for level in range(levels):
+        form_class = make_form_class(per_level, bases=(form_class,), prefix="level_{}".format(level))
+    return form_class
+
+
+def make_reference_form_class(field_count):
+    """
+    Creates an entangled form for model `Product`, whose fields alternately reference one user
+    or a list of categories.
+    """
+    attrs, names = {}, field_names(field_count)
+    for index, name in enumerate(names):
+        if index % 2:
+            attrs[name] = ModelMultipleChoiceField(queryset=Category.objects.all())
+        else:
+            attrs[name] = ModelChoiceField(queryset=get_user_model().objects.all())
+    attrs['Meta'] = type('Meta', (), {
+        'model': Product,
+        'untangled_fields': ['name'],
+        'entangled_fields': {'properties': names},
+    })
+    return type('ReferenceForm{}'.format(field_count), (EntangledModelForm,), attrs)
+
+
+def make_reference_instance(form_class):
+    users = list(get_user_model().objects.values_list('pk', flat=True))
+    categories = list(Category.objects.values_list('pk', flat=True))
+    properties = {}
+    for index, name in enumerate(form_class._meta.entangled_fields['properties']):
+        if index % 2:
+            properties[name] = {'model': 'tests.category', 'p_keys': categories}
+        else:
+            properties[name] = {'model': 'auth.user', 'pk': users[index % len(users)]}
+    return Product.objects.create(name="Product", properties=properties)
+
+
+def make_data(form_class):
+    return dict({name: "value" for name in form_class.base_fields}, name="Product")
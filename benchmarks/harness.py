@@ -0,0 +1,49 @@
+import timeit
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class Result:
+    def __init__(self, name, field_count, seconds, peak_bytes, queries):
+        self.name = name
+        self.field_count = field_count
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+        self.queries = queries
+
+    def __str__(self):
+        return "{:<40} {:>6} {:>12} {:>12} {:>8}".format(
+            self.name, self.field_count, format_seconds(self.seconds),
+            "{:.1f} KiB".format(self.peak_bytes / 1024), self.queries,
+        )
+
+
+HEADER = "{:<40} {:>6} {:>12} {:>12} {:>8}".format("benchmark", "fields", "time/call", "peak alloc", "queries")
+
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return "{:.2f} {}".format(seconds / scale, unit)
+    return "{:.0f} ns".format(seconds * 1e9)
+
+
+def measure(name, field_count, func, repeat=5):
+    """
+    Measures the best time per call of `func` out of `repeat` rounds, the peak of memory allocated
+    by one call and the number of database queries issued by one call.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    with CaptureQueriesContext(connection) as context:
+        func()
+    return Result(name, field_count, seconds, peak_bytes, len(context))
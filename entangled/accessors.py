@@ -0,0 +1,105 @@
+from django.core.exceptions import ValidationError
+from django.utils.module_loading import import_string
+
+from .codecs import decode_value
+from .forms import EntangledFieldPlan
+
+
+class EntangledAccessor:
+    """
+    Declare this descriptor on a model to access the entangled fields of a form as attributes of its
+    instances, without instantiating that form::
+
+        class Product(models.Model):
+            properties = models.JSONField()
+            entangled = EntangledAccessor('shop.forms.ProductForm')
+
+        product.entangled.color    # converted by the form field's `to_python`
+        product.entangled.tenant   # resolves the referenced object
+
+    To avoid circular imports, the form class may be given by its dotted path. It is imported on first use.
+    """
+    def __init__(self, form_class):
+        self._form_class = form_class
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    @property
+    def form_class(self):
+        if isinstance(self._form_class, str):
+            self._form_class = import_string(self._form_class)
+        return self._form_class
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        data = EntangledData(instance, self.form_class)
+        # cache the accessor on the instance, like a cached_property, delete it to reset
+        instance.__dict__[self.name] = data
+        return data
+
+    def prefetch(self, instances):
+        """
+        Fetches the objects referenced by the entangled fields of all given instances using one query per
+        related model, so that accessing them does not query the database anymore. Returns a list of
+        those instances.
+        """
+        instances = list(instances)
+        related_objects = self.form_class.prefetch_related_objects(instances)
+        for instance in instances:
+            getattr(instance, self.name)._related_objects = related_objects
+        return instances
+
+
+class EntangledData:
+    """
+    Attribute based view onto the entangled fields of a model instance. Values are converted lazily and
+    cached. All objects referenced by the instance are fetched on first access to any of them.
+    """
+    def __init__(self, instance, form_class):
+        self._instance = instance
+        self._form_class = form_class
+        self._plans = {plan.name: plan for plan in form_class._meta.entangled_plan}
+        self._values = {}
+        self._related_objects = None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        try:
+            plan = self._plans[name]
+        except KeyError:
+            raise AttributeError("{} has no entangled field '{}'".format(self._form_class.__name__, name))
+        self._values[name] = value = self._convert(plan)
+        return value
+
+    def __dir__(self):
+        return list(self._plans.keys())
+
+    def __repr__(self):
+        return "<{} of {}>".format(self.__class__.__name__, self._instance)
+
+    def _convert(self, plan):
+        try:
+            value = plan.get_value(getattr(self._instance, plan.json_field))
+        except (KeyError, TypeError):
+            return None
+        if plan.kind == EntangledFieldPlan.VALUE:
+            if value is None:
+                return None
+            codec = self._form_class._meta.entangled_codecs.get(plan.name)
+            if codec:
+                return decode_value(codec, value)
+            try:
+                return self._form_class.base_fields[plan.name].to_python(value)
+            except ValidationError:
+                return value
+        if self._related_objects is None:
+            self._related_objects = self._form_class.prefetch_related_objects([self._instance])
+        return plan.unpack_value(value, self._related_objects)
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class EntangledConfig(AppConfig):
+    name = 'entangled'
+    verbose_name = "Entangled Forms"
+
+    def ready(self):
+        from .utils import load_model_tokens
+
+        load_model_tokens()
@@ -0,0 +1,136 @@
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+_current_cache = ContextVar('entangled_reference_cache', default=None)
+_active_caches = weakref.WeakSet()
+_active_caches_lock = threading.Lock()
+
+
+class ReferenceCache:
+    """
+    Bounded LRU cache of objects referenced by entangled fields, keyed by their model label and primary key.
+    Primary keys of objects which do not exist are cached as well, mapping onto None.
+    """
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self._objects = OrderedDict()
+        self._labels = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get_many(self, label, p_keys):
+        """
+        Returns a dictionary of the cached objects for the given primary keys and the set of primary keys
+        which are not cached.
+        """
+        found, missing = {}, set()
+        with self._lock:
+            for pk in p_keys:
+                try:
+                    found[pk] = self._objects[label, pk]
+                except KeyError:
+                    missing.add(pk)
+                else:
+                    self._objects.move_to_end((label, pk))
+        return found, missing
+
+    def set_many(self, label, objects):
+        """
+        Adds a dictionary of objects, keyed by their primary key, for the model with the given label.
+        """
+        from .utils import get_model, get_model_label
+
+        concrete_label = get_model_label(get_model(label)._meta.concrete_model)
+        with self._lock:
+            self._labels.setdefault(concrete_label, set()).add(label)
+            for pk, obj in objects.items():
+                self._objects[label, pk] = obj
+                self._objects.move_to_end((label, pk))
+            while len(self._objects) > self.maxsize:
+                self._objects.popitem(last=False)
+
+    def invalidate(self, model, pk):
+        """
+        Removes the object of the given model, and its proxy and concrete models, from the cache.
+        """
+        from .utils import get_model_label
+
+        with self._lock:
+            for label in self._labels.get(get_model_label(model._meta.concrete_model), ()):
+                self._objects.pop((label, pk), None)
+
+    def clear(self):
+        with self._lock:
+            self._objects.clear()
+
+
+def get_reference_cache():
+    """
+    Returns the reference cache of the current context, or None.
+    """
+    return _current_cache.get()
+
+
+@contextmanager
+def reference_cache(maxsize=None):
+    """
+    Context manager activating a `ReferenceCache`, which is consulted for all objects referenced by entangled
+    fields, until the block is left. Objects saved or deleted meanwhile are removed from that cache.
+    """
+    if maxsize is None:
+        maxsize = getattr(settings, 'ENTANGLED_REFERENCE_CACHE_SIZE', 1000)
+    cache = ReferenceCache(maxsize)
+    with _active_caches_lock:
+        _active_caches.add(cache)
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+        with _active_caches_lock:
+            _active_caches.discard(cache)
+
+
+class ReferenceCacheMiddleware:
+    """
+    Middleware activating a reference cache for each request.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with reference_cache():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with reference_cache():
+            return await self.get_response(request)
+
+
+def _invalidate_references(sender, instance, **kwargs):
+    if not _active_caches:
+        return
+    with _active_caches_lock:
+        caches = list(_active_caches)
+    for cache in caches:
+        cache.invalidate(sender, instance.pk)
+
+
+post_save.connect(_invalidate_references, dispatch_uid='entangled_invalidate_references_on_save')
+post_delete.connect(_invalidate_references, dispatch_uid='entangled_invalidate_references_on_delete')
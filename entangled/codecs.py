@@ -0,0 +1,127 @@
+import json
+import uuid
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.forms import fields
+from django.utils.dateparse import parse_date, parse_datetime, parse_duration, parse_time
+from django.utils.duration import duration_iso_string
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Codec:
+    """
+    Converts the cleaned values of a form field into their representation inside a JSON field and back.
+    Method `decode` shall raise a `ValueError` or `TypeError` for values it can not convert.
+    """
+    def encode(self, value):
+        return value
+
+    def decode(self, value):
+        return value
+
+
+class ParserCodec(Codec):
+    def __init__(self, parser, encoder=None):
+        self.parser = parser
+        self.encoder = encoder
+
+    def encode(self, value):
+        return self.encoder(value) if self.encoder else value.isoformat()
+
+    def decode(self, value):
+        parsed = self.parser(value)
+        if parsed is None:
+            raise ValueError("Can not decode {!r}".format(value))
+        return parsed
+
+
+class DecimalCodec(Codec):
+    def encode(self, value):
+        # a string keeps the precision of the decimal
+        return str(value)
+
+    def decode(self, value):
+        return Decimal(str(value))
+
+
+class UUIDCodec(Codec):
+    def encode(self, value):
+        return str(value)
+
+    def decode(self, value):
+        return uuid.UUID(value)
+
+
+_codecs = {}
+
+
+def register_codec(field_class, codec):
+    """
+    Registers a codec for all form fields of the given class and its subclasses. Form classes use the
+    codecs registered at the time they are declared.
+    """
+    _codecs[field_class] = codec
+
+
+def get_codec(field):
+    """
+    Returns the codec registered for the class of the given form field or its nearest base class, or None.
+    """
+    for field_class in type(field).__mro__:
+        if field_class in _codecs:
+            return _codecs[field_class]
+
+
+def decode_value(codec, value):
+    """
+    Decodes a value read from a JSON field, returning it unchanged if it can not be decoded.
+    """
+    if value is None:
+        return None
+    try:
+        return codec.decode(value)
+    except (ArithmeticError, TypeError, ValueError):
+        return value
+
+
+register_codec(fields.DateField, ParserCodec(parse_date))
+register_codec(fields.DateTimeField, ParserCodec(parse_datetime))
+register_codec(fields.SplitDateTimeField, ParserCodec(parse_datetime))
+register_codec(fields.TimeField, ParserCodec(parse_time))
+register_codec(fields.DurationField, ParserCodec(parse_duration, duration_iso_string))
+register_codec(fields.DecimalField, DecimalCodec())
+register_codec(fields.UUIDField, UUIDCodec())
+
+
+class EntangledJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder for the `encoder` argument of a `JSONField`. If the package `orjson` is installed,
+    it is used for serialization, otherwise this behaves like the `DjangoJSONEncoder`.
+    """
+    def encode(self, o):
+        if orjson is None or self.indent is not None or self.sort_keys:
+            return super().encode(o)
+        try:
+            return orjson.dumps(o, default=self.default).decode()
+        except (TypeError, orjson.JSONEncodeError):
+            # for instance non-string keys or integers exceeding 64 bits
+            return super().encode(o)
+
+
+class EntangledJSONDecoder(json.JSONDecoder):
+    """
+    JSON decoder for the `decoder` argument of a `JSONField`. If the package `orjson` is installed,
+    it is used for deserialization.
+    """
+    def decode(self, s, *args, **kwargs):
+        if orjson is None or self.object_hook or self.object_pairs_hook:
+            return super().decode(s, *args, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().decode(s, *args, **kwargs)
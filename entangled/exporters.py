@@ -0,0 +1,87 @@
+import csv
+import json
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model
+
+
+def export_rows(form_class, queryset=None, chunk_size=2000):
+    """
+    Generator yielding one flat dictionary per object in `queryset`, which by default contains all
+    objects of the form's model. The keys are the names of the untangled and entangled fields of the
+    entangled form `form_class`. Values of entangled fields are read from their JSON fields, where
+    references stored by model choice fields are resolved into their objects. Objects are streamed in
+    chunks of `chunk_size` and all references of each chunk are resolved using one query per model.
+    """
+    opts = form_class._meta
+    if queryset is None:
+        queryset = opts.model._default_manager.all()
+    untangled_fields = _get_untangled_fields(opts)
+    related_fields = [name for name in untangled_fields if opts.model._meta.get_field(name).is_relation]
+    if related_fields:
+        queryset = queryset.select_related(*related_fields)
+    iterator = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        related_objects = form_class.prefetch_related_objects(chunk)
+        for instance in chunk:
+            row = {name: getattr(instance, name) for name in untangled_fields}
+            for plan in opts.entangled_plan:
+                try:
+                    value = plan.get_value(getattr(instance, plan.json_field))
+                except (KeyError, TypeError):
+                    value = None
+                row[plan.name] = plan.unpack_value(value, related_objects)
+            yield row
+
+
+def get_export_fields(form_class):
+    """
+    Returns the names of the columns exported for the given entangled form.
+    """
+    opts = form_class._meta
+    return _get_untangled_fields(opts) + [plan.name for plan in opts.entangled_plan]
+
+
+def _get_untangled_fields(opts):
+    model_fields = {field.name for field in opts.model._meta.concrete_fields}
+    return [name for name in opts.untangled_fields if name in model_fields]
+
+
+def export_csv(form_class, fileobj, queryset=None, chunk_size=2000):
+    """
+    Writes the rows generated by `export_rows` as CSV into the file-like object `fileobj`.
+    Related objects are written using their string representation, separated by commas for
+    fields using a `ModelMultipleChoiceField`.
+    """
+    writer = csv.DictWriter(fileobj, fieldnames=get_export_fields(form_class))
+    writer.writeheader()
+    for row in export_rows(form_class, queryset, chunk_size):
+        writer.writerow({key: _to_csv(value) for key, value in row.items()})
+
+
+def export_ndjson(form_class, fileobj, queryset=None, chunk_size=2000):
+    """
+    Writes the rows generated by `export_rows` as newline delimited JSON into the file-like object
+    `fileobj`. Related objects are written using their string representation.
+    """
+    for row in export_rows(form_class, queryset, chunk_size):
+        fileobj.write(json.dumps({key: _to_json(value) for key, value in row.items()}, cls=DjangoJSONEncoder))
+        fileobj.write("\n")
+
+
+def _to_csv(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return str(value) if isinstance(value, Model) else value
+
+
+def _to_json(value):
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    return str(value) if isinstance(value, Model) else value
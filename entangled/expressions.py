@@ -0,0 +1,112 @@
+import json
+
+from django.db import NotSupportedError
+from django.db.models import Expression, F, JSONField
+
+
+class JSONBMerge(Expression):
+    """
+    Expression which sets the given values inside a PostgreSQL `jsonb` column, leaving all other
+    keys of that column untouched. Values are given as a mapping of paths (tuples of keys) onto
+    their new content, which may also be an expression evaluating to `jsonb`. Missing intermediate
+    objects are created on the fly. Instead of a field name, another `jsonb` expression can be given
+    as the base to merge into.
+    """
+    # the maximum number of arguments accepted by a PostgreSQL function is 100
+    max_pairs = 50
+
+    def __init__(self, field_name, values, encoder=None):
+        super().__init__(output_field=JSONField(encoder=encoder))
+        self.expression = F(field_name) if isinstance(field_name, str) else field_name
+        self.values = dict(values)
+        self.encoder = encoder
+        self._expression_paths = [path for path, value in self.values.items() if hasattr(value, 'resolve_expression')]
+
+    def get_source_expressions(self):
+        return [self.expression] + [self.values[path] for path in self._expression_paths]
+
+    def set_source_expressions(self, exprs):
+        self.expression, *values = exprs
+        self.values = dict(self.values, **dict(zip(self._expression_paths, values)))
+
+    def as_sql(self, compiler, connection):
+        raise NotSupportedError("{} is only supported on PostgreSQL.".format(self.__class__.__name__))
+
+    def as_postgresql(self, compiler, connection):
+        tree = {}
+        for path, value in self.values.items():
+            node = tree
+            for part in path[:-1]:
+                node = node.setdefault(part, {})
+                if not isinstance(node, dict):
+                    raise ValueError("Path {} overlaps with another path".format(".".join(path)))
+            node[path[-1]] = _Leaf(value)
+        column_sql, column_params = compiler.compile(self.expression)
+        return self._merge_sql(compiler, column_sql, list(column_params), [], tree)
+
+    def _merge_sql(self, compiler, column_sql, column_params, path, tree):
+        if path:
+            base_sql = "({} #> %s::text[])".format(column_sql)
+            base_params = column_params + [path]
+        else:
+            base_sql, base_params = column_sql, column_params
+        sql = "CASE WHEN jsonb_typeof({0}) = 'object' THEN {0} ELSE '{{}}'::jsonb END".format(base_sql)
+        params = base_params + base_params
+        items = list(tree.items())
+        for offset in range(0, len(items), self.max_pairs):
+            pairs_sql = []
+            for key, node in items[offset:offset + self.max_pairs]:
+                if isinstance(node, _Leaf) and hasattr(node.value, 'resolve_expression'):
+                    value_sql, value_params = compiler.compile(node.value)
+                    pairs_sql.append("%s::text, {}".format(value_sql))
+                    params.extend([key] + list(value_params))
+                elif isinstance(node, _Leaf):
+                    pairs_sql.append("%s::text, %s::jsonb")
+                    params.extend([key, json.dumps(node.value, cls=self.encoder)])
+                else:
+                    node_sql, node_params = self._merge_sql(compiler, column_sql, column_params, path + [key], node)
+                    pairs_sql.append("%s::text, {}".format(node_sql))
+                    params.extend([key] + node_params)
+            sql = "({} || jsonb_build_object({}))".format(sql, ", ".join(pairs_sql))
+        return sql, params
+
+
+class JSONBExtractPath(Expression):
+    """
+    Expression extracting the content at the given path (a tuple of keys) from a PostgreSQL `jsonb`
+    column or expression.
+    """
+    template = "({} #> %s::text[])"
+
+    def __init__(self, field_name, path):
+        super().__init__(output_field=JSONField())
+        self.expression = F(field_name) if isinstance(field_name, str) else field_name
+        self.path = list(path)
+
+    def get_source_expressions(self):
+        return [self.expression]
+
+    def set_source_expressions(self, exprs):
+        (self.expression,) = exprs
+
+    def as_sql(self, compiler, connection):
+        raise NotSupportedError("{} is only supported on PostgreSQL.".format(self.__class__.__name__))
+
+    def as_postgresql(self, compiler, connection):
+        sql, params = compiler.compile(self.expression)
+        return self.template.format(sql), list(params) + [self.path]
+
+
+class JSONBRemovePath(JSONBExtractPath):
+    """
+    Expression removing the content at the given path (a tuple of keys) from a PostgreSQL `jsonb`
+    column or expression.
+    """
+    template = "({} #- %s::text[])"
+
+
+class _Leaf:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
@@ -1,21 +1,27 @@
 import itertools
 import traceback
+import weakref
 from copy import deepcopy, copy
+from functools import lru_cache
 from warnings import warn
 
-from django.apps import apps
-from django.core.exceptions import ObjectDoesNotExist
+from asgiref.sync import sync_to_async
 from django import forms
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.forms.models import (
     ModelChoiceField,
     ModelMultipleChoiceField,
     ModelFormMetaclass,
     ModelForm,
+    modelform_factory,
 )
 from django.forms.fields import Field
 from django.forms.widgets import Widget
+from django.db import DatabaseError, connections, transaction
 from django.db.models import JSONField, Model, QuerySet
 
+from . import codecs, instrumentation, utils
+
 
 class InvisibleWidget(Widget):
     @property
@@ -40,26 +46,155 @@ class EntangledField(Field):
         super().__init__(required=required, *args, **kwargs)
 
 
+class EntangledFieldPlan:
+    """
+    Precompiled access plan of an entangled form field, pointing into the data of its JSON field.
+    """
+    VALUE, OBJECT, OBJECT_LIST = "value", "object", "object_list"
+
+    __slots__ = ("name", "json_field", "path", "kind")
+
+    def __init__(self, name, json_field, path, kind):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "json_field", json_field)
+        object.__setattr__(self, "path", tuple(path))
+        object.__setattr__(self, "kind", kind)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(self.__class__.__name__))
+
+    def __reduce__(self):
+        return self.__class__, (self.name, self.json_field, self.path, self.kind)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "<{} {}: {}.{} ({})>".format(
+            self.__class__.__name__, self.name, self.json_field, ".".join(self.path), self.kind
+        )
+
+    @classmethod
+    def get_kind(cls, field):
+        if isinstance(field, ModelMultipleChoiceField):
+            return cls.OBJECT_LIST
+        if isinstance(field, ModelChoiceField):
+            return cls.OBJECT
+        return cls.VALUE
+
+    @classmethod
+    def for_field(cls, name, json_field, path, field):
+        return cls(name, json_field, path.split("."), cls.get_kind(field))
+
+    def get_value(self, data):
+        """
+        Returns the value addressed by this plan. Raises KeyError or TypeError if it is missing.
+        """
+        for part in self.path:
+            data = data[part]
+        return data
+
+    def pack_value(self, value, field, compact=False):
+        """
+        Converts a cleaned value of the given form field into its representation inside the JSON field.
+        If `compact` is set, references store the token of their model rather than its label.
+        """
+        if self.kind == self.OBJECT_LIST and isinstance(value, (QuerySet, list, tuple)):
+            # a queryset already has been evaluated while cleaning the field
+            model = value.model if isinstance(value, QuerySet) else field.queryset.model
+            reference = self._get_model_reference(model, compact)
+            reference["p_keys"] = [obj.pk for obj in value]
+            return reference
+        if self.kind == self.OBJECT and isinstance(value, Model):
+            reference = self._get_model_reference(value.__class__, compact)
+            reference["pk"] = value.pk
+            return reference
+        return value
+
+    @staticmethod
+    def _get_model_reference(model, compact):
+        label = utils.get_model_label(model)
+        if compact:
+            return {"m": utils.get_model_token(label)}
+        return {"model": label}
+
+    def unpack_value(self, value, related_objects):
+        """
+        Converts a value read from the JSON field into the objects it references, looking them up in
+        `related_objects`, as returned by `utils.fetch_related_objects`. Values of fields which do not
+        reference any objects are returned unchanged. Unresolvable references are returned as None.
+        """
+        try:
+            if self.kind == self.OBJECT:
+                label = utils.get_reference_label(value)
+                return related_objects[label].get(utils.normalize_pk(label, value["pk"]))
+            if self.kind == self.OBJECT_LIST:
+                label = utils.get_reference_label(value)
+                objects = related_objects[label]
+                p_keys = (utils.normalize_pk(label, pk) for pk in value["p_keys"])
+                return [objects[pk] for pk in p_keys if objects.get(pk) is not None]
+        except (KeyError, TypeError):
+            return None
+        return value
+
+    def set_value(self, data, value):
+        """
+        Stores the value addressed by this plan, creating intermediate dictionaries on the fly.
+        """
+        for part in self.path[:-1]:
+            data = data.setdefault(part, {})
+        data[self.path[-1]] = value
+
+
+class SharedFields(dict):
+    """
+    The `base_fields` of entangled forms declaring `Meta.entangled_shared_fields`. When a form instance
+    deep copies them, only fields whose state may be modified by the instance are copied, ie. model choice
+    fields, since their queryset is evaluated and restricted by `limit_choices_to`. All other field objects
+    are shared across instances and must be treated as read-only.
+    """
+    def __deepcopy__(self, memo):
+        return {
+            name: deepcopy(field, memo) if hasattr(field, "get_limit_choices_to") else field
+            for name, field in self.items()
+        }
+
+
+_registered_forms = weakref.WeakSet()
+
+
+def get_registered_forms():
+    """
+    Returns all entangled form classes declaring a model and entangled fields, created so far.
+    """
+    return list(_registered_forms)
+
+
 class EntangledFormMetaclass(ModelFormMetaclass):
     def __new__(cls, class_name, bases, attrs):
         attrs.setdefault("Meta", type("Meta", (), {}))
         untangled_fields = list(getattr(attrs["Meta"], "untangled_fields", []))
-        entangled_fields = deepcopy(getattr(attrs["Meta"], "entangled_fields", {}))
-        retangled_fields = deepcopy(getattr(attrs["Meta"], "retangled_fields", {}))
+        entangled_fields = {
+            key: list(fields) for key, fields in getattr(attrs["Meta"], "entangled_fields", {}).items()
+        }
+        retangled_fields = dict(getattr(attrs["Meta"], "retangled_fields", {}))
 
-        # Merge untangled and entangled fields from base classes
+        # Merge untangled and entangled fields from base classes, keeping their order (dicts serve as ordered sets)
         for base in bases:
             if hasattr(base, "_meta"):
                 untangled_fields = getattr(base._meta, "untangled_fields", []) + untangled_fields
                 for key, fields in getattr(base._meta, "entangled_fields", {}).items():
-                    existing_fields = entangled_fields.setdefault(key, [])
+                    existing_fields = dict.fromkeys(entangled_fields.get(key, ()))
                     entangled_fields[key] = [
-                                                field for field in fields if field not in existing_fields
-                                            ] + existing_fields
+                        field for field in fields if field not in existing_fields
+                    ] + list(existing_fields)
+        untangled_fields = list(dict.fromkeys(untangled_fields))
         for entangled_list in entangled_fields.values():
             for ef in entangled_list:
-                if ef not in retangled_fields:
-                    retangled_fields[ef] = ef
+                retangled_fields.setdefault(ef, ef)
 
         # Modify entangled fields to respect Meta.fields and Meta.exclude
         fields = getattr(attrs["Meta"], "fields", None)
@@ -81,13 +216,14 @@ class EntangledFormMetaclass(ModelFormMetaclass):
                 )
             else:
                 fieldset = list(fields)  # Create a copy
+                fieldset_names = set(fieldset)
                 # Alter remove fields not listed in Meta.fields
-                fields_to_delete = set(itertools.chain(*entangled_fields.values())) - set(fieldset)
-                fields_to_delete.update(set(untangled_fields) - set(fieldset))
+                fields_to_delete = set(itertools.chain(*entangled_fields.values())) - fieldset_names
+                fields_to_delete.update(set(untangled_fields) - fieldset_names)
                 # Remove fields not listed in Meta.fields from entangled_fields
                 for field_name in entangled_fields.keys():
                     entangled_fields[field_name] = [
-                        field for field in entangled_fields[field_name] if field in fieldset
+                        field for field in entangled_fields[field_name] if field in fieldset_names
                     ]
                     # Ensure the JSON field is declared as EntangledField
                     attrs[field_name] = EntangledField() if entangled_fields[field_name] else None
@@ -115,51 +251,240 @@ class EntangledFormMetaclass(ModelFormMetaclass):
         new_class._meta.entangled_fields = entangled_fields
         new_class._meta.untangled_fields = untangled_fields
         new_class._meta.retangled_fields = retangled_fields
+        new_class._meta.entangled_partial_update = cls._get_option(
+            attrs["Meta"], bases, "entangled_partial_update", False
+        )
+        new_class._meta.entangled_shared_fields = cls._get_option(
+            attrs["Meta"], bases, "entangled_shared_fields", False
+        )
+        if new_class._meta.entangled_shared_fields:
+            new_class.base_fields = SharedFields(new_class.base_fields)
+        new_class._meta.entangled_compact_references = cls._get_option(
+            attrs["Meta"], bases, "entangled_compact_references", False
+        )
+        new_class._meta.entangled_plan = cls._create_entangled_plan(
+            bases, entangled_fields, retangled_fields, new_class.base_fields
+        )
+        entangled_codecs = {}
+        for plan in new_class._meta.entangled_plan:
+            codec = codecs.get_codec(new_class.base_fields[plan.name])
+            if codec and plan.kind == EntangledFieldPlan.VALUE:
+                entangled_codecs[plan.name] = codec
+        new_class._meta.entangled_codecs = entangled_codecs
+        mirrored_fields = cls._get_option(attrs["Meta"], bases, "mirrored_fields", {})
+        if not isinstance(mirrored_fields, dict):
+            mirrored_fields = {field_name: field_name for field_name in mirrored_fields}
+        entangled_plan = {plan.name: plan for plan in new_class._meta.entangled_plan}
+        for field_name, model_field_name in mirrored_fields.items():
+            assert (
+                field_name in entangled_plan
+            ), "Field {} listed in `{}.Meta.mirrored_fields` is not an entangled field".format(field_name, class_name)
+            assert (
+                entangled_plan[field_name].kind != EntangledFieldPlan.OBJECT_LIST
+            ), "Field {} listed in `{}.Meta.mirrored_fields` can not be mirrored into a single column".format(
+                field_name, class_name
+            )
+            if new_class._meta.model:
+                assert (
+                    new_class._meta.model._meta.get_field(model_field_name).concrete
+                ), "Field {} listed in `{}.Meta.mirrored_fields` is not a concrete field of model {}".format(
+                    model_field_name, class_name, new_class._meta.model._meta.label
+                )
+        new_class._meta.mirrored_fields = mirrored_fields
+
+        if new_class._meta.model and new_class._meta.entangled_plan:
+            _registered_forms.add(new_class)
         return new_class
 
+    @classmethod
+    def _get_option(cls, meta, bases, name, default):
+        if hasattr(meta, name):
+            return getattr(meta, name)
+        for base in bases:
+            if hasattr(base, "_meta") and hasattr(base._meta, name):
+                return getattr(base._meta, name)
+        return default
+
+    @classmethod
+    def _create_entangled_plan(cls, bases, entangled_fields, retangled_fields, base_fields):
+        # reuse the plans of base classes, if their fields are stored at the same location
+        base_plans = {}
+        for base in reversed(bases):
+            if hasattr(base, "_meta") and hasattr(base._meta, "entangled_plan"):
+                base_retangled_fields = base._meta.retangled_fields
+                for plan in base._meta.entangled_plan:
+                    base_plans[plan.name] = (plan, base_retangled_fields.get(plan.name))
+        entangled_plan = []
+        for field_name, assigned_fields in entangled_fields.items():
+            for af in assigned_fields:
+                plan, path = base_plans.get(af, (None, None))
+                field = base_fields[af]
+                if (plan is None or plan.json_field != field_name or path != retangled_fields[af]
+                        or plan.kind != EntangledFieldPlan.get_kind(field)):
+                    plan = EntangledFieldPlan.for_field(af, field_name, retangled_fields[af], field)
+                entangled_plan.append(plan)
+        return tuple(entangled_plan)
+
     @classmethod
     def _create_fields_option(cls, untangled_fields, entangled_fields, fields_to_delete):
-        fields = list(untangled_fields)  # creates a copy for modification
+        fields = dict.fromkeys(untangled_fields)
         for entangled in entangled_fields.values():
-            fields += entangled
-        fields += list(entangled_fields.keys())
-        for field in fields_to_delete:
-            if field in fields:
-                fields.remove(field)
-        return fields
+            fields.update(dict.fromkeys(entangled))
+        fields.update(dict.fromkeys(entangled_fields.keys()))
+        return [field for field in fields if field not in fields_to_delete]
 
 
 class EntangledModelFormMixin(metaclass=EntangledFormMetaclass):
-    def __init__(self, *args, **kwargs):
-        opts = self._meta
-        if "instance" in kwargs and kwargs["instance"]:
-            initial = kwargs.get("initial", {})
-            for field_name, assigned_fields in opts.entangled_fields.items():
-                for af in assigned_fields:
-                    reference = getattr(kwargs["instance"], field_name)
-                    try:
-                        for part in opts.retangled_fields[af].split("."):
-                            reference = reference[part]
-                    except (KeyError, TypeError):
-                        continue
-                    if isinstance(self.base_fields[af], ModelMultipleChoiceField):
-                        try:
-                            Model = apps.get_model(reference["model"])
-                            initial[af] = Model.objects.filter(
-                                pk__in=reference["p_keys"]
-                            )
-                        except (KeyError, TypeError):
-                            pass
-                    elif isinstance(self.base_fields[af], ModelChoiceField):
-                        try:
-                            Model = apps.get_model(reference["model"])
-                            initial[af] = Model.objects.get(pk=reference["pk"])
-                        except (KeyError, ObjectDoesNotExist, TypeError):
-                            pass
-                    else:
-                        initial[af] = reference
-            kwargs.setdefault("initial", initial)
-        super().__init__(*args, **kwargs)
+    def __init__(self, *args, related_objects=None, **kwargs):
+        with instrumentation.measure(self.__class__, "init") as report:
+            self._entangled_stored = {}
+            if "instance" in kwargs and kwargs["instance"]:
+                initial = kwargs.get("initial", {})
+                references, related_fields = self._collect_references(
+                    kwargs["instance"], initial, self._entangled_stored
+                )
+
+                # fetch all referenced objects, which have not been prefetched, using one query per model
+                related_objects = related_objects or {}
+                missing = {
+                    label: {pk for pk in p_keys if pk not in related_objects.get(label, {})}
+                    for label, p_keys in references.items()
+                }
+                fetched_objects = utils.fetch_related_objects(
+                    {label: p_keys for label, p_keys in missing.items() if p_keys}
+                )
+
+                def get_object(label, pk):
+                    if pk in missing[label]:
+                        return fetched_objects[label][pk]
+                    return related_objects[label][pk]
+
+                for af, label, pk in related_fields:
+                    if isinstance(pk, list):
+                        objects = (get_object(label, p) for p in pk if p is not None)
+                        initial[af] = [obj for obj in objects if obj is not None]
+                    elif get_object(label, pk) is not None:
+                        initial[af] = get_object(label, pk)
+                kwargs.setdefault("initial", initial)
+                if report:
+                    report.references = sum(len(p_keys) for p_keys in references.values())
+                    report.json_size = instrumentation.get_json_size(self._meta.model, {
+                        field_name: getattr(kwargs["instance"], field_name, None)
+                        for field_name in self._meta.entangled_fields.keys()
+                    })
+            super().__init__(*args, **kwargs)
+            if not self.instance._state.adding:
+                # snapshot of the model fields to detect changes applied to the instance after this point
+                self._instance_values = self._get_instance_values()
+
+    @classmethod
+    def prefetch_related_objects(cls, instances):
+        """
+        Fetches the objects referenced by the entangled fields of all given instances, using one query
+        per related model. Pass the result as `related_objects` when instantiating this form for any of
+        those instances, so that the form itself does not have to query the database.
+        """
+        references = {}
+        for instance in instances:
+            for label, p_keys in cls._collect_references(instance)[0].items():
+                references.setdefault(label, set()).update(p_keys)
+        return utils.fetch_related_objects(references)
+
+    @classmethod
+    async def aprefetch_related_objects(cls, instances):
+        """
+        Asynchronous variant of `prefetch_related_objects`.
+        """
+        references = {}
+        for instance in instances:
+            for label, p_keys in cls._collect_references(instance)[0].items():
+                references.setdefault(label, set()).update(p_keys)
+        return await utils.afetch_related_objects(references)
+
+    @classmethod
+    async def acreate(cls, *args, related_objects=None, **kwargs):
+        """
+        Creates a form instance from within asynchronous code. The objects referenced by the entangled
+        fields of the given instance are fetched asynchronously, querying all related models concurrently.
+        """
+        instance = kwargs.get("instance")
+        if instance:
+            related_objects = dict(related_objects or {})
+            references = cls._collect_references(instance)[0]
+            missing = {
+                label: {pk for pk in p_keys if pk not in related_objects.get(label, {})}
+                for label, p_keys in references.items()
+            }
+            fetched_objects = await utils.afetch_related_objects(
+                {label: p_keys for label, p_keys in missing.items() if p_keys}
+            )
+            for label, objects in fetched_objects.items():
+                related_objects[label] = {**related_objects.get(label, {}), **objects}
+        return cls(*args, related_objects=related_objects, **kwargs)
+
+    async def ais_valid(self):
+        """
+        Asynchronous variant of `is_valid`. Since form fields may query the database while being cleaned,
+        validation runs in a thread.
+        """
+        return await sync_to_async(self.is_valid)()
+
+    async def asave(self, commit=True):
+        """
+        Asynchronous variant of `save`.
+        """
+        return await sync_to_async(self.save)(commit)
+
+    @classmethod
+    def _collect_references(cls, instance, initial=None, stored=None):
+        """
+        Collects the primary keys of all objects referenced by the entangled fields of the given instance,
+        grouped by their model label. Values of all other entangled fields are copied into `initial`.
+        If `stored` is given, a copy of each raw value found in the JSON fields is kept there.
+        """
+        if initial is None:
+            initial = {}
+        references = {}
+        related_fields = []
+        for plan in cls._meta.entangled_plan:
+            try:
+                reference = plan.get_value(getattr(instance, plan.json_field))
+            except (KeyError, TypeError):
+                continue
+            if stored is not None:
+                # in shared fields mode, stored values are not copied, since they are replaced rather than modified
+                stored[plan.name] = reference if cls._meta.entangled_shared_fields else deepcopy(reference)
+            if plan.kind == EntangledFieldPlan.OBJECT_LIST:
+                try:
+                    label, p_keys = utils.get_reference_label(reference), list(reference["p_keys"])
+                except (KeyError, TypeError):
+                    continue
+                p_keys = [utils.normalize_pk(label, pk) for pk in p_keys]
+                references.setdefault(label, set()).update(pk for pk in p_keys if pk is not None)
+                related_fields.append((plan.name, label, p_keys))
+            elif plan.kind == EntangledFieldPlan.OBJECT:
+                try:
+                    label, pk = utils.get_reference_label(reference), reference["pk"]
+                except (KeyError, TypeError):
+                    continue
+                pk = utils.normalize_pk(label, pk)
+                if pk is not None:
+                    references.setdefault(label, set()).add(pk)
+                    related_fields.append((plan.name, label, pk))
+            elif plan.name in cls._meta.entangled_codecs:
+                initial[plan.name] = codecs.decode_value(cls._meta.entangled_codecs[plan.name], reference)
+            else:
+                initial[plan.name] = reference
+        return references, related_fields
+
+    def full_clean(self):
+        with instrumentation.measure(self.__class__, "clean") as report:
+            super().full_clean()
+            if report and hasattr(self, "cleaned_data"):
+                report.json_size = instrumentation.get_json_size(self._meta.model, {
+                    field_name: self.cleaned_data[field_name]
+                    for field_name in self._meta.entangled_fields.keys() if field_name in self.cleaned_data
+                })
 
     def _clean_form(self):
         opts = self._meta
@@ -169,43 +494,225 @@ class EntangledModelFormMixin(metaclass=EntangledFormMetaclass):
             for f in opts.untangled_fields
             if f in self.cleaned_data
         }
-        for field_name, assigned_fields in opts.entangled_fields.items():
+        if opts.model:
+            # keep the model fields generated by `Meta.fields`, which are not listed in `untangled_fields`
+            entangled_names = {plan.name for plan in opts.entangled_plan}
+            for f, value in self.cleaned_data.items():
+                if f not in cleaned_data and f not in entangled_names and f not in opts.entangled_fields:
+                    try:
+                        opts.model._meta.get_field(f)
+                    except FieldDoesNotExist:
+                        continue
+                    cleaned_data[f] = value
+        for field_name in opts.entangled_fields.keys():
             # Keep other fields in JSON
             if self.instance and hasattr(self.instance, field_name):
                 cleaned_data[field_name] = getattr(self.instance, field_name) or {}
             else:
                 cleaned_data[field_name] = {}
-            for af in assigned_fields:
-                if af not in self.cleaned_data:
-                    continue
-                bucket = cleaned_data[field_name]
-                af_parts = opts.retangled_fields[af].split(".")
-                for part in af_parts[:-1]:
-                    bucket = bucket.setdefault(part, {})
-                part = af_parts[-1]
-                if isinstance(
-                    self.base_fields[af], ModelMultipleChoiceField
-                ) and isinstance(self.cleaned_data[af], QuerySet):
-                    meta = self.cleaned_data[af].model._meta
-                    value = {
-                        "model": "{}.{}".format(meta.app_label, meta.model_name),
-                        "p_keys": list(
-                            self.cleaned_data[af].values_list("pk", flat=True)
-                        ),
-                    }
-                elif isinstance(self.base_fields[af], ModelChoiceField) and isinstance(
-                    self.cleaned_data[af], Model
-                ):
-                    meta = self.cleaned_data[af]._meta
-                    value = {
-                        "model": "{}.{}".format(meta.app_label, meta.model_name),
-                        "pk": self.cleaned_data[af].pk,
-                    }
-                else:
-                    value = self.cleaned_data[af]
-                bucket[part] = value
+        self._entangled_values = {field_name: {} for field_name in opts.entangled_fields.keys()}
+        self._mirrored_values = {}
+        for plan in opts.entangled_plan:
+            if plan.name not in self.cleaned_data:
+                continue
+            value = self.cleaned_data[plan.name]
+            if plan.name in opts.mirrored_fields:
+                self._mirrored_values[opts.mirrored_fields[plan.name]] = value
+            value = plan.pack_value(value, self.fields[plan.name], opts.entangled_compact_references)
+            if value is not None and plan.name in opts.entangled_codecs:
+                value = opts.entangled_codecs[plan.name].encode(value)
+            plan.set_value(cleaned_data[plan.json_field], value)
+            if self._entangled_value_has_changed(plan, value):
+                self._entangled_values[plan.json_field][plan.path] = value
         self.cleaned_data = cleaned_data
 
+    def _post_clean(self):
+        # synchronize the mirrored model fields before the instance is validated, so that their
+        # uniqueness, length and foreign key constraints are checked by the model validation
+        for model_field_name, value in getattr(self, "_mirrored_values", {}).items():
+            model_field = self.instance._meta.get_field(model_field_name)
+            if isinstance(value, Model) and not model_field.is_relation:
+                value = value.pk
+            setattr(self.instance, model_field_name, value)
+        super()._post_clean()
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        if hasattr(self, "_mirrored_values"):
+            exclude.difference_update(self._mirrored_values.keys())
+        return exclude
+
+    def _update_errors(self, errors):
+        # report errors of mirrored model fields on their entangled form fields
+        if hasattr(errors, "error_dict") and self._meta.mirrored_fields:
+            form_field_names = {
+                model_field_name: field_name for field_name, model_field_name in self._meta.mirrored_fields.items()
+            }
+            error_dict = {}
+            for field, messages in errors.error_dict.items():
+                if field not in self.fields and field in form_field_names:
+                    field = form_field_names[field]
+                error_dict.setdefault(field, []).extend(messages)
+            errors = ValidationError(error_dict)
+        super()._update_errors(errors)
+
+    def _get_instance_values(self):
+        json_fields = self._meta.entangled_fields.keys()
+        return {
+            field.name: deepcopy(value) if isinstance(value, (dict, list)) else value
+            for field in self.instance._meta.concrete_fields
+            if not field.primary_key and field.name not in json_fields
+            for value in (field.value_from_object(self.instance),)
+        }
+
+    def _entangled_value_has_changed(self, plan, value):
+        try:
+            stored = self._entangled_stored[plan.name]
+        except KeyError:
+            return True
+        if plan.kind == EntangledFieldPlan.OBJECT_LIST and isinstance(value, dict):
+            # the order of primary keys is irrelevant
+            try:
+                stored_model = {key: val for key, val in stored.items() if key != "p_keys"}
+                model = {key: val for key, val in value.items() if key != "p_keys"}
+                return stored_model != model or set(stored["p_keys"]) != set(value["p_keys"])
+            except (AttributeError, KeyError, TypeError):
+                return True
+        return stored != value
+
+    def get_writable_field(self, name):
+        """
+        Returns the field `name` of this form instance, ready to be modified without affecting other form
+        instances. In shared fields mode, that field is copied on first invocation.
+        """
+        field = self.fields[name]
+        if field is self.base_fields.get(name):
+            field = self.fields[name] = deepcopy(field)
+            self._bound_fields_cache.pop(name, None)
+        return field
+
+    @property
+    def changed_entangled_paths(self):
+        """
+        Returns the set of paths inside the JSON fields, whose values have been changed by this form.
+        Each path is a dotted string starting with the name of its JSON field, for instance
+        `properties.variants.color`. Only available after the form has been validated.
+        """
+        return {
+            ".".join((field_name,) + path)
+            for field_name, values in self._entangled_values.items()
+            for path in values.keys()
+        }
+
+    def save(self, commit=True):
+        with instrumentation.measure(self.__class__, "save") as report:
+            if commit and self._meta.entangled_partial_update and not self.instance._state.adding:
+                instance = self._save_partial()
+                # only the changed values have been written
+                json_data = {
+                    field_name: {".".join(path): value for path, value in values.items()}
+                    for field_name, values in self._entangled_values.items()
+                }
+            elif commit and not self.instance._state.adding:
+                instance = self._save_changed()
+                # only the JSON fields containing changed values have been written
+                json_data = {
+                    field_name: getattr(instance, field_name, None)
+                    for field_name, values in self._entangled_values.items() if values
+                }
+            else:
+                instance = super().save(commit)
+                json_data = None
+            if report:
+                if json_data is None:
+                    json_data = {
+                        field_name: getattr(instance, field_name, None)
+                        for field_name in self._meta.entangled_fields.keys()
+                    }
+                report.json_size = instrumentation.get_json_size(self._meta.model, json_data)
+        return instance
+
+    def _check_saveable(self):
+        if self.errors:
+            raise ValueError(
+                "The {} could not be changed because the data didn't validate.".format(
+                    self.instance._meta.object_name
+                )
+            )
+
+    def _get_changed_model_fields(self):
+        """
+        Returns the names of the model fields, other than the JSON fields, which have been changed by this
+        form or on its instance since this form has been created, including the mirrored fields. If anything
+        changed, including any entangled value, the fields with `auto_now` are added.
+        """
+        opts = self._meta
+        json_fields = opts.entangled_fields.keys()
+        instance_values = getattr(self, "_instance_values", {})
+        changed_fields = [
+            field.name for field in self.instance._meta.concrete_fields
+            if not field.primary_key and field.name not in json_fields and (
+                field.name in self.changed_data or field.name in instance_values
+                and field.value_from_object(self.instance) != instance_values[field.name]
+            )
+        ]
+        for plan in opts.entangled_plan:
+            model_field_name = opts.mirrored_fields.get(plan.name)
+            changed_paths = self._entangled_values[plan.json_field]
+            if model_field_name not in (None, *changed_fields) and plan.path in changed_paths:
+                changed_fields.append(model_field_name)
+        if changed_fields or any(self._entangled_values.values()):
+            # fields with `auto_now` are only refreshed, if they are part of `update_fields`
+            changed_fields.extend(
+                field.name for field in self.instance._meta.concrete_fields
+                if getattr(field, "auto_now", False) and field.name not in changed_fields
+            )
+        return changed_fields
+
+    def _save_changed(self):
+        """
+        Saves the instance, leaving the JSON fields without changed entangled values out of the `UPDATE`.
+        If neither any model field nor any entangled value has changed, nothing is written to the database.
+        """
+        self._check_saveable()
+        if self._get_changed_model_fields() or any(self._entangled_values.values()):
+            unchanged_json_fields = {name for name, values in self._entangled_values.items() if not values}
+            if unchanged_json_fields:
+                update_fields = [
+                    field.name for field in self.instance._meta.concrete_fields
+                    if not field.primary_key and field.name not in unchanged_json_fields
+                ]
+            else:
+                update_fields = None
+            self._save_instance(update_fields)
+        self._save_m2m()
+        return self.instance
+
+    def _save_instance(self, update_fields):
+        try:
+            self.instance.save(update_fields=update_fields)
+        except DatabaseError as error:
+            if not update_fields or type(error) is not DatabaseError or "did not affect any rows" not in str(error):
+                raise
+            # the row has been deleted meanwhile, insert it again, as a save without `update_fields` does
+            using = self.instance._state.db
+            if connections[using].in_atomic_block:
+                transaction.set_rollback(False, using=using)
+            self.instance.save()
+
+    def _save_partial(self):
+        """
+        Saves only the model fields and the entangled paths changed by this form or on its instance,
+        leaving all other model fields and all other content of the JSON fields untouched. If nothing
+        changed, nothing is written to the database.
+        """
+        self._check_saveable()
+        self._save_instance(self._get_changed_model_fields())
+        for field_name, values in self._entangled_values.items():
+            utils.update_json_paths(self.instance, field_name, values)
+        self._save_m2m()
+        return self.instance
+
 
 class EntangledModelForm(EntangledModelFormMixin, ModelForm):
     """
@@ -213,16 +720,56 @@ class EntangledModelForm(EntangledModelFormMixin, ModelForm):
     """
 
 
-def get_related_object(scope, field_name):
-    from . import utils
+class _FrozenDict(tuple):
+    """
+    Hashable representation of a dictionary, used as part of a cache key.
+    """
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
 
+
+def _thaw(value):
+    if isinstance(value, _FrozenDict):
+        return {key: _thaw(val) for key, val in value}
+    return value
+
+
+@lru_cache(maxsize=128)
+def _cached_modelform_factory(model, form, options):
+    return modelform_factory(model, form=form, **{name: _thaw(value) for name, value in options})
+
+
+def entangled_modelform_factory(model, form=EntangledModelForm, **kwargs):
+    """
+    Variant of Django's `modelform_factory`, which returns the same form class when invoked again with
+    the same arguments. The 128 most recently used form classes are kept. If any argument is not
+    hashable, the form class is created without caching. Since the returned classes are shared, they
+    must not be modified.
+    """
+    try:
+        options = tuple((name, _freeze(value)) for name, value in sorted(kwargs.items()))
+        hash(options)
+    except TypeError:
+        return modelform_factory(model, form=form, **kwargs)
+    return _cached_modelform_factory(model, form, options)
+
+
+entangled_modelform_factory.cache_clear = _cached_modelform_factory.cache_clear
+entangled_modelform_factory.cache_info = _cached_modelform_factory.cache_info
+
+
+def get_related_object(scope, field_name):
     warn("Please import 'get_related_object' from entangled.utils", DeprecationWarning)
     return utils.get_related_object(scope, field_name)
 
 
 def get_related_queryset(scope, field_name):
-    from . import utils
-
     warn(
         "Please import 'get_related_queryset' from entangled.utils", DeprecationWarning
     )
@@ -0,0 +1,32 @@
+from django.forms.models import BaseInlineFormSet, BaseModelFormSet
+from django.utils.functional import cached_property
+
+from .forms import EntangledModelFormMixin
+
+
+class EntangledFormSetMixin:
+    """
+    Prefetches the objects referenced by the entangled fields of all instances in the formset's
+    queryset, using one query per related model, and passes them to each form of this formset.
+    """
+    def get_form_kwargs(self, index):
+        kwargs = super().get_form_kwargs(index)
+        if issubclass(self.form, EntangledModelFormMixin):
+            kwargs["related_objects"] = self.related_objects
+        return kwargs
+
+    @cached_property
+    def related_objects(self):
+        return self.form.prefetch_related_objects(self.get_queryset())
+
+
+class BaseEntangledModelFormSet(EntangledFormSetMixin, BaseModelFormSet):
+    """
+    Use this class as `formset` argument in `modelformset_factory`.
+    """
+
+
+class BaseEntangledInlineFormSet(EntangledFormSetMixin, BaseInlineFormSet):
+    """
+    Use this class as `formset` argument in `inlineformset_factory` or in an `InlineModelAdmin`.
+    """
@@ -0,0 +1,261 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
+from functools import lru_cache
+from itertools import islice
+
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.validators import ProhibitNullCharactersValidator
+from django.db import transaction
+from django.forms.models import ModelChoiceField, ModelMultipleChoiceField, apply_limit_choices_to_to_formfield
+from django.forms.utils import ErrorDict
+from django.utils.module_loading import import_string
+
+from .forms import EntangledModelFormMixin
+
+
+class PrefetchedChoicesMixin:
+    """
+    Resolves the values of a `ModelChoiceField` or `ModelMultipleChoiceField` from a dictionary of
+    prefetched objects, keyed by the string representation of their primary key (or `to_field_name`),
+    rather than querying the database for each cleaned value.
+    """
+    prefetched_objects = None
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        ProhibitNullCharactersValidator()(value)
+        if isinstance(value, self.queryset.model):
+            value = getattr(value, self.to_field_name or "pk")
+        try:
+            return self.prefetched_objects[str(value)]
+        except KeyError:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+    def _check_values(self, value):
+        try:
+            value = list(dict.fromkeys(value))
+        except TypeError:
+            raise ValidationError(
+                self.error_messages["invalid_list"],
+                code="invalid_list",
+            )
+        objects = []
+        for val in value:
+            ProhibitNullCharactersValidator()(val)
+            try:
+                objects.append(self.prefetched_objects[str(val)])
+            except KeyError:
+                raise ValidationError(
+                    self.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": val},
+                )
+        return objects
+
+
+@lru_cache(maxsize=None)
+def _get_prefetched_field_class(field_class):
+    return type("Prefetched" + field_class.__name__, (PrefetchedChoicesMixin, field_class), {})
+
+
+def _get_choices_queryset(field):
+    # forms apply `limit_choices_to` to their field instances only, not to the declared fields
+    field = deepcopy(field)
+    apply_limit_choices_to_to_formfield(field)
+    return field.queryset
+
+
+def prefetch_choices(form_class, rows):
+    """
+    Fetches all objects referenced by the values of the model choice fields of `form_class` in all
+    given rows. Fields sharing the same queryset are fetched by one query. Returns a dictionary
+    mapping the field names onto dictionaries of prefetched objects.
+    """
+    querysets = {}
+    for name, field in form_class.base_fields.items():
+        if not isinstance(field, ModelChoiceField) or field.queryset is None:
+            continue
+        queryset = _get_choices_queryset(field)
+        key = field.to_field_name or "pk"
+        model_field = queryset.model._meta.pk if key == "pk" else queryset.model._meta.get_field(key)
+        values = set()
+        for row in rows:
+            value = row.get(name)
+            if isinstance(field, ModelMultipleChoiceField):
+                value = value if isinstance(value, (list, tuple)) else [value]
+            else:
+                value = [value]
+            for val in value:
+                if val in field.empty_values:
+                    continue
+                try:
+                    values.add(model_field.to_python(val))
+                except (TypeError, ValidationError):
+                    continue
+        try:
+            queryset_key = (queryset.model, key, str(queryset.query))
+        except EmptyResultSet:
+            queryset_key = (queryset.model, key, name)
+        querysets.setdefault(queryset_key, (queryset, set(), []))
+        querysets[queryset_key][1].update(values)
+        querysets[queryset_key][2].append(name)
+
+    prefetched_choices = {}
+    for (model, key, _), (queryset, values, names) in querysets.items():
+        if values:
+            objects = {str(getattr(obj, key)): obj for obj in queryset.filter(**{key + "__in": values})}
+        else:
+            objects = {}
+        for name in names:
+            prefetched_choices[name] = objects
+    return prefetched_choices
+
+
+def use_prefetched_choices(form, prefetched_choices):
+    """
+    Replaces the model choice fields of a form instance by variants using the given prefetched objects.
+    """
+    for name, objects in prefetched_choices.items():
+        if name in form.fields:
+            field = copy(form.fields[name])
+            field.__class__ = _get_prefetched_field_class(form.fields[name].__class__)
+            field.prefetched_objects = objects
+            form.fields[name] = field
+
+
+class ImportResult:
+    """
+    The outcome of `import_rows`. Attribute `errors` maps the index of each rejected row onto the
+    errors of its form.
+    """
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.errors = {}
+
+    def __repr__(self):
+        return "<{} created={} updated={} errors={}>".format(
+            self.__class__.__name__, self.created, self.updated, len(self.errors)
+        )
+
+
+def import_rows(form_class, rows, batch_size=500, lookup_field=None):
+    """
+    Imports an iterable of flat dictionaries, validating each of them through the entangled form
+    `form_class`, which packs the entangled fields into their JSON fields. The rows are consumed
+    lazily and written in batches of `batch_size` using `bulk_create`. If `lookup_field` is given,
+    rows whose value for that field matches an existing object are written using `bulk_update`
+    instead. For each batch, the objects referenced by model choice fields are fetched using one
+    query per model. Many-to-many relations of the model are not imported.
+    """
+    assert issubclass(form_class, EntangledModelFormMixin), "{} is not an entangled form".format(form_class)
+    opts = form_class._meta
+    model = opts.model
+    # `opts.fields` is None for `fields = '__all__'`, hence derive the written fields from the form fields
+    form_fields = set(form_class.base_fields).union(opts.entangled_fields.keys(), opts.mirrored_fields.values())
+    update_fields = [
+        field.name for field in model._meta.concrete_fields if not field.primary_key and field.name in form_fields
+    ]
+    if lookup_field:
+        lookup_model_field = model._meta.pk if lookup_field == "pk" else model._meta.get_field(lookup_field)
+    result = ImportResult()
+    rows = iter(rows)
+    offset = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        lookups = {}
+        if lookup_field:
+            for index, row in enumerate(batch):
+                try:
+                    lookups[index] = lookup_model_field.to_python(row[lookup_field])
+                except (KeyError, TypeError, ValidationError):
+                    continue
+            existing = model._default_manager.in_bulk(
+                [value for value in lookups.values() if value is not None], field_name=lookup_field
+            )
+            related_objects = form_class.prefetch_related_objects(existing.values())
+        else:
+            existing, related_objects = {}, {}
+        prefetched_choices = prefetch_choices(form_class, batch)
+        created, updated = [], []
+        for index, row in enumerate(batch):
+            instance = existing.get(lookups.get(index))
+            form = form_class(data=row, instance=instance, related_objects=related_objects)
+            use_prefetched_choices(form, prefetched_choices)
+            if form.is_valid():
+                (updated if instance else created).append(form.save(commit=False))
+            else:
+                result.errors[offset + index] = form.errors
+        with transaction.atomic(using=model._default_manager.db):
+            if created:
+                model._default_manager.bulk_create(created, batch_size=batch_size)
+            if updated and update_fields:
+                model._default_manager.bulk_update(updated, update_fields, batch_size=batch_size)
+        result.created += len(created)
+        result.updated += len(updated)
+        offset += len(batch)
+    return result
+
+
+def clean_row(form_class, row, prefetched_choices):
+    """
+    Cleans one row of data through the given entangled form, without touching the database. The
+    objects referenced by model choice fields must have been fetched using `prefetch_choices`.
+    Model validation, which may require database access, is skipped. Returns a tuple containing the
+    cleaned data, with the entangled fields packed into their JSON fields, and a dictionary of errors.
+    """
+    form = form_class(data=row)
+    use_prefetched_choices(form, prefetched_choices)
+    form._errors = ErrorDict()
+    form.cleaned_data = {}
+    form._clean_fields()
+    if not form._errors:
+        form._clean_form()
+    if form._errors:
+        return None, form._errors.as_data()
+    return form.cleaned_data, {}
+
+
+_worker_state = {}
+
+
+def _init_worker(form_path, pickled_choices):
+    from django import setup
+    from django.apps import apps
+
+    if not apps.ready:
+        setup()
+    _worker_state['form_class'] = import_string(form_path)
+    _worker_state['prefetched_choices'] = pickle.loads(pickled_choices)
+
+
+def _clean_rows(rows):
+    form_class, prefetched_choices = _worker_state['form_class'], _worker_state['prefetched_choices']
+    return [clean_row(form_class, row, prefetched_choices) for row in rows]
+
+
+def validate_rows(form_class, rows, processes=None, chunk_size=100):
+    """
+    Validates a list of flat dictionaries through the entangled form `form_class`, distributing the
+    field cleaning and the packing of the JSON fields onto a pool of `processes` worker processes.
+    All objects referenced by model choice fields are fetched beforehand in this process, so that
+    the workers never access the database. The form class must be declared at module level.
+    Returns a list of tuples `(cleaned_data, errors)` in the order of the given rows.
+    """
+    rows = list(rows)
+    prefetched_choices = prefetch_choices(form_class, rows)
+    if processes == 1 or len(rows) <= chunk_size:
+        return [clean_row(form_class, row, prefetched_choices) for row in rows]
+    form_path = "{}.{}".format(form_class.__module__, form_class.__qualname__)
+    chunks = [rows[offset:offset + chunk_size] for offset in range(0, len(rows), chunk_size)]
+    initargs = (form_path, pickle.dumps(prefetched_choices))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=initargs) as executor:
+        return [result for results in executor.map(_clean_rows, chunks) for result in results]
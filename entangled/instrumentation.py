@@ -0,0 +1,99 @@
+import json
+from contextlib import ExitStack, nullcontext
+from time import perf_counter
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+
+# registered callables, replaced as a whole on each change so that they can be iterated without locking
+observers = ()
+
+
+def register_observer(callback):
+    """
+    Registers a callable, which is invoked with a `Report` each time an entangled form has been
+    initialized, cleaned or saved. Returns the callback, so that this function can be used as decorator.
+    """
+    global observers
+    if callback not in observers:
+        observers = observers + (callback,)
+    return callback
+
+
+def unregister_observer(callback):
+    global observers
+    observers = tuple(observer for observer in observers if observer != callback)
+
+
+class Report:
+    """
+    Metrics of one phase, ie. `init`, `clean` or `save`, of an entangled form. Attribute `duration`
+    is measured in seconds, `json_size` is the size in bytes of the serialized JSON fields handled in
+    that phase and `references` is the number of related objects referenced by the stored JSON fields.
+    """
+    def __init__(self, form_class, phase):
+        self.form_class = form_class
+        self.phase = phase
+        self.duration = 0.0
+        self.queries = 0
+        self.field_count = len(form_class._meta.entangled_plan)
+        self.json_size = 0
+        self.references = 0
+
+    def __repr__(self):
+        return "<{} {}.{} duration={:.6f} queries={} fields={} json_size={} references={}>".format(
+            self.__class__.__name__, self.form_class.__qualname__, self.phase, self.duration, self.queries,
+            self.field_count, self.json_size, self.references,
+        )
+
+
+class _Measurement:
+    def __init__(self, form_class, phase):
+        self.report = Report(form_class, phase)
+        self.exit_stack = ExitStack()
+
+    def __enter__(self):
+        for connection in connections.all():
+            self.exit_stack.enter_context(connection.execute_wrapper(self.count_query))
+        self.start = perf_counter()
+        return self.report
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.report.duration = perf_counter() - self.start
+        self.exit_stack.close()
+        if exc_type is None:
+            for observer in observers:
+                observer(self.report)
+
+    def count_query(self, execute, sql, params, many, context):
+        self.report.queries += 1
+        return execute(sql, params, many, context)
+
+
+def measure(form_class, phase):
+    """
+    Context manager measuring the enclosed phase of an entangled form, yielding its `Report` to be
+    completed by the caller. Without registered observers, this is a no-op yielding `None`.
+    """
+    if not observers:
+        return nullcontext()
+    return _Measurement(form_class, phase)
+
+
+def get_json_size(model, data):
+    """
+    Returns the size in bytes of the serialized content of JSON fields, given as a mapping of their
+    names onto their content.
+    """
+    size = 0
+    for field_name, value in data.items():
+        try:
+            encoder = getattr(model._meta.get_field(field_name), 'encoder', None)
+        except (AttributeError, FieldDoesNotExist):
+            encoder = None
+        try:
+            size += len(json.dumps(value, cls=encoder or DjangoJSONEncoder).encode())
+        except (TypeError, ValueError):
+            continue
+    return size
@@ -0,0 +1,171 @@
+import hashlib
+import itertools
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.migrations import Migration
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.operations import AddIndex, RemoveIndex, SeparateDatabaseAndState
+from django.db.migrations.writer import MigrationWriter
+from django.db.models import F, Index
+from django.utils.module_loading import autodiscover_modules
+
+from entangled.forms import EntangledFieldPlan, get_registered_forms
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates migrations adding database indexes on the JSON keys used by entangled forms "
+        "and reports all entangled keys without an index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'app_label', nargs='*',
+            help="Restrict to models of these applications.",
+        )
+        parser.add_argument(
+            '--fields', nargs='+', default=[], metavar='FIELD',
+            help="Names of the entangled form fields, whose JSON keys shall be indexed.",
+        )
+        parser.add_argument(
+            '--gin', action='store_true',
+            help="Add a GIN index to each JSON field used by entangled forms, and to the lists of references "
+                 "of the given fields (PostgreSQL only).",
+        )
+        parser.add_argument(
+            '--name', default='entangled_indexes',
+            help="Use this name for the migration files.",
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Just show the migrations which would be created.",
+        )
+
+    def handle(self, *app_labels, **options):
+        autodiscover_modules('forms')
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        project_state = loader.project_state()
+        operations = {}
+        for model, json_fields in self.collect_entangled_keys(app_labels).items():
+            opts = model._meta
+            try:
+                model_state = project_state.models[opts.app_label, opts.model_name]
+            except KeyError:
+                existing_indexes = {index.name for index in opts.indexes}
+            else:
+                existing_indexes = {index.name for index in model_state.options.get('indexes', [])}
+            existing_indexes.update(self.get_database_indexes(loader, opts.app_label, opts.model_name))
+            app_operations = operations.setdefault(opts.app_label, [])
+            for json_field, paths in json_fields.items():
+                if options['gin']:
+                    index = self.create_gin_index(model, json_field)
+                    if index.name not in existing_indexes:
+                        app_operations.append(AddIndex(opts.model_name, index))
+                        existing_indexes.add(index.name)
+                for (path, kind), field_names in paths.items():
+                    if kind == EntangledFieldPlan.OBJECT_LIST:
+                        # lookups on lists of references (`p_keys__contains`) require a GIN index on that very path
+                        if not options['gin']:
+                            self.report_unindexed(model, json_field, path, field_names)
+                            continue
+                        index = self.create_gin_index(model, json_field, path + ('p_keys',))
+                    else:
+                        index = self.create_index(model, json_field, path, kind)
+                    if index.name in existing_indexes:
+                        continue
+                    if field_names.intersection(options['fields']):
+                        app_operations.append(AddIndex(opts.model_name, index))
+                        existing_indexes.add(index.name)
+                    else:
+                        self.report_unindexed(model, json_field, path, field_names)
+
+        for app_label, app_operations in operations.items():
+            if app_operations:
+                self.write_migration(loader, app_label, app_operations, options)
+
+    @staticmethod
+    def get_database_indexes(loader, app_label, model_name):
+        """
+        Returns the names of the indexes, which previous runs of this command added to the database only.
+        """
+        index_names = set()
+        plan = dict.fromkeys(itertools.chain.from_iterable(
+            loader.graph.forwards_plan(leaf_node) for leaf_node in loader.graph.leaf_nodes(app_label)
+        ))
+        for key in plan:
+            if key[0] != app_label:
+                continue
+            for operation in loader.graph.nodes[key].operations:
+                if not isinstance(operation, SeparateDatabaseAndState):
+                    continue
+                for db_operation in operation.database_operations:
+                    if getattr(db_operation, 'model_name_lower', None) != model_name:
+                        continue
+                    if isinstance(db_operation, AddIndex):
+                        index_names.add(db_operation.index.name)
+                    elif isinstance(db_operation, RemoveIndex):
+                        index_names.discard(db_operation.name)
+        return index_names
+
+    def collect_entangled_keys(self, app_labels):
+        entangled_keys = {}
+        for form_class in get_registered_forms():
+            model = form_class._meta.model
+            if app_labels and model._meta.app_label not in app_labels:
+                continue
+            for plan in form_class._meta.entangled_plan:
+                paths = entangled_keys.setdefault(model, {}).setdefault(plan.json_field, {})
+                paths.setdefault((plan.path, plan.kind), set()).add(plan.name)
+        return entangled_keys
+
+    def create_index(self, model, json_field, path, kind):
+        lookup = '__'.join((json_field,) + path)
+        if kind == EntangledFieldPlan.OBJECT:
+            lookup += '__pk'
+        return Index(F(lookup), name=self.get_index_name(model, lookup))
+
+    def create_gin_index(self, model, json_field, path=()):
+        from django.contrib.postgres.indexes import GinIndex, OpClass
+
+        if not path:
+            name = self.get_index_name(model, json_field + ':gin')
+            return GinIndex(fields=[json_field], name=name, opclasses=['jsonb_path_ops'])
+        lookup = '__'.join((json_field,) + path)
+        name = self.get_index_name(model, lookup + ':gin')
+        return GinIndex(OpClass(F(lookup), name='jsonb_path_ops'), name=name)
+
+    @staticmethod
+    def get_index_name(model, lookup):
+        # index names are limited to 30 characters
+        digest = hashlib.sha1('{}.{}'.format(model._meta.db_table, lookup).encode()).hexdigest()
+        return '{}_{}_ent'.format(model._meta.model_name[:15], digest[:10])
+
+    def report_unindexed(self, model, json_field, path, field_names):
+        self.stdout.write("Unindexed: {} {} (form field {})".format(
+            model._meta.label,
+            '.'.join((json_field,) + path),
+            ", ".join("'{}'".format(name) for name in sorted(field_names)),
+        ))
+
+    def write_migration(self, loader, app_label, operations, options):
+        leaf_nodes = loader.graph.leaf_nodes(app_label)
+        if leaf_nodes:
+            number = (MigrationAutodetector.parse_number(leaf_nodes[0][1]) or 0) + 1
+        elif options['dry_run']:
+            number = 1
+        else:
+            raise CommandError("App '{}' does not have migrations.".format(app_label))
+        migration = Migration('{:04d}_{}'.format(number, options['name']), app_label)
+        migration.dependencies = leaf_nodes
+        # the indexes are not declared in `Meta.indexes` of their models, hence keep them out of the migration state,
+        # otherwise `makemigrations` would remove them again
+        migration.operations = [SeparateDatabaseAndState(database_operations=operations)]
+        writer = MigrationWriter(migration)
+        if options['dry_run']:
+            self.stdout.write("Migration for '{}':".format(app_label))
+            self.stdout.write(writer.as_string())
+            return
+        with open(writer.path, 'w', encoding='utf-8') as fh:
+            fh.write(writer.as_string())
+        self.stdout.write("Created migration {}".format(writer.path))
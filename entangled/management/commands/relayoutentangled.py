@@ -0,0 +1,76 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError
+
+from entangled.utils import relayout_json_field
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves the values of entangled fields inside a JSON field from their old to their new paths, "
+        "after their mapping in 'Meta.retangled_fields' has been changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model',
+            help="The model in the form 'app_label.ModelName'.",
+        )
+        parser.add_argument(
+            'json_field',
+            help="The name of the JSON field holding the entangled fields.",
+        )
+        parser.add_argument(
+            '--move', nargs='+', required=True, metavar='OLD_PATH=NEW_PATH',
+            help="Dotted paths inside the JSON field, where values are moved from and to.",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Number of objects loaded and written per batch.",
+        )
+        parser.add_argument(
+            '--start-after', metavar='PK',
+            help="Resume an interrupted run after the object with this primary key.",
+        )
+        parser.add_argument(
+            '--sql', action='store_true',
+            help="Move the values by one UPDATE statement per path, without loading any objects (PostgreSQL only).",
+        )
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help="Nominates a database to rewrite. Defaults to the 'default' database.",
+        )
+
+    def handle(self, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as exc:
+            raise CommandError(str(exc))
+        old_layout, new_layout = {}, {}
+        for index, move in enumerate(options['move']):
+            try:
+                old_layout[index], new_layout[index] = move.split('=')
+            except ValueError:
+                raise CommandError("Expected OLD_PATH=NEW_PATH, got '{}'.".format(move))
+        try:
+            count = relayout_json_field(
+                model._base_manager.using(options['database']),
+                options['json_field'],
+                old_layout,
+                new_layout,
+                batch_size=options['batch_size'],
+                start_after=options['start_after'],
+                progress=self.report_progress,
+                use_sql=options['sql'],
+            )
+        except (NotSupportedError, ValueError) as exc:
+            raise CommandError(str(exc))
+        self.stdout.write("Rewrote {} objects of {}.".format(count, model._meta.label))
+
+    def report_progress(self, processed, count, last_pk):
+        if last_pk is None:
+            self.stdout.write("Updated {} rows.".format(count))
+        else:
+            self.stdout.write("Processed {} objects, rewrote {}, last primary key {}.".format(
+                processed, count, last_pk
+            ))
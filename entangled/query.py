@@ -0,0 +1,180 @@
+from django.db.models import F, Manager, Model, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+
+from .forms import EntangledFieldPlan
+
+
+class EntangledQuerySet(QuerySet):
+    """
+    A QuerySet which accepts the field names of an entangled form in `filter`, `exclude`, `order_by`,
+    `values`, `values_list`, `annotate` and `alias`, translating them into lookups on the JSON keys
+    they are stored in. Use method `entangled()` to specify the form class::
+
+        Product.objects.entangled(ProductForm).filter(color='red', tenant=request.user)
+    """
+    _entangled_plans = None
+    _entangled_codecs = None
+    _entangled_prefetch = ()
+    _encoded_lookups = ("", "exact", "in", "range", "gt", "gte", "lt", "lte")
+
+    def entangled(self, form_class):
+        clone = self._chain()
+        clone._entangled_plans = {plan.name: plan for plan in form_class._meta.entangled_plan}
+        clone._entangled_codecs = form_class._meta.entangled_codecs
+        return clone
+
+    def prefetch_entangled(self, *accessor_names):
+        """
+        Fetches the objects referenced through the given `EntangledAccessor`s of the model, using one
+        query per related model, when this QuerySet is evaluated.
+        """
+        clone = self._chain()
+        clone._entangled_prefetch = self._entangled_prefetch + accessor_names
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._entangled_plans = self._entangled_plans
+        clone._entangled_codecs = self._entangled_codecs
+        clone._entangled_prefetch = self._entangled_prefetch
+        return clone
+
+    def _fetch_all(self):
+        prefetch = self._result_cache is None and self._entangled_prefetch
+        super()._fetch_all()
+        if prefetch and self._result_cache and isinstance(self._result_cache[0], Model):
+            for accessor_name in self._entangled_prefetch:
+                getattr(self.model, accessor_name).prefetch(self._result_cache)
+
+    def filter(self, *args, **kwargs):
+        return super().filter(*self._translate_args(args), **self._translate_kwargs(kwargs))
+
+    def exclude(self, *args, **kwargs):
+        return super().exclude(*self._translate_args(args), **self._translate_kwargs(kwargs))
+
+    def order_by(self, *field_names):
+        if self._entangled_plans:
+            field_names = [self._translate_ordering(name) for name in field_names]
+        return super().order_by(*field_names)
+
+    def values(self, *fields, **expressions):
+        fields, expressions = self._translate_fields(fields, expressions)
+        return super().values(*fields, **expressions)
+
+    def values_list(self, *fields, **kwargs):
+        return super().values_list(*self._translate_args(fields, as_expression=True), **kwargs)
+
+    def annotate(self, *args, **kwargs):
+        return super().annotate(*self._translate_args(args), **self._translate_kwargs(kwargs, as_lookup=False))
+
+    def alias(self, *args, **kwargs):
+        return super().alias(*self._translate_args(args), **self._translate_kwargs(kwargs, as_lookup=False))
+
+    def _get_plan(self, name):
+        if self._entangled_plans and isinstance(name, str):
+            field_name, *rest = name.split(LOOKUP_SEP, 1)
+            if field_name in self._entangled_plans:
+                return self._entangled_plans[field_name], rest[0] if rest else ""
+        return None, name
+
+    @staticmethod
+    def _json_path(plan, *parts):
+        return LOOKUP_SEP.join((plan.json_field,) + plan.path + tuple(part for part in parts if part))
+
+    def _translate_name(self, name):
+        plan, rest = self._get_plan(name)
+        if plan is None:
+            return name
+        if plan.kind == EntangledFieldPlan.OBJECT and rest in ("", "exact", "in"):
+            return self._json_path(plan, "pk", rest)
+        return self._json_path(plan, rest)
+
+    def _translate_ordering(self, name):
+        if isinstance(name, str) and name.startswith("-"):
+            return "-" + self._translate_name(name[1:])
+        return self._translate_expression(self._translate_name(name))
+
+    def _translate_lookup(self, lookup, value):
+        plan, rest = self._get_plan(lookup)
+        value = self._translate_expression(value)
+        if plan is None:
+            return lookup, value
+        if plan.kind == EntangledFieldPlan.OBJECT:
+            if rest in ("", "exact"):
+                return self._json_path(plan, "pk"), self._get_pk(value)
+            if rest == "in":
+                return self._json_path(plan, "pk", "in"), [self._get_pk(v) for v in value]
+        elif plan.kind == EntangledFieldPlan.OBJECT_LIST and rest in ("", "exact", "contains"):
+            # matches if all given objects are referenced
+            values = value if isinstance(value, (list, tuple, set, QuerySet)) else [value]
+            return self._json_path(plan, "p_keys", "contains"), [self._get_pk(v) for v in values]
+        elif plan.name in self._entangled_codecs and rest in self._encoded_lookups:
+            # compare with the representation of the value inside the JSON field
+            codec = self._entangled_codecs[plan.name]
+            if rest in ("in", "range"):
+                return self._json_path(plan, rest), [self._encode_value(codec, v) for v in value]
+            return self._json_path(plan, rest), self._encode_value(codec, value)
+        return self._json_path(plan, rest), value
+
+    @staticmethod
+    def _encode_value(codec, value):
+        if value is None or hasattr(value, "resolve_expression"):
+            return value
+        return codec.encode(value)
+
+    @staticmethod
+    def _get_pk(value):
+        return value.pk if isinstance(value, Model) else value
+
+    def _translate_kwargs(self, kwargs, as_lookup=True):
+        if not self._entangled_plans:
+            return kwargs
+        if as_lookup:
+            return dict(self._translate_lookup(lookup, value) for lookup, value in kwargs.items())
+        return {key: self._translate_expression(value) for key, value in kwargs.items()}
+
+    def _translate_args(self, args, as_expression=False):
+        if not self._entangled_plans:
+            return args
+        translated = []
+        for arg in args:
+            if as_expression and self._get_plan(arg)[0]:
+                arg = F(self._translate_name(arg))
+            translated.append(self._translate_expression(arg))
+        return translated
+
+    def _translate_fields(self, fields, expressions):
+        if not self._entangled_plans:
+            return fields, expressions
+        translated_fields = []
+        expressions = {key: self._translate_expression(value) for key, value in expressions.items()}
+        for field in fields:
+            if self._get_plan(field)[0]:
+                expressions[field] = F(self._translate_name(field))
+            else:
+                translated_fields.append(field)
+        return translated_fields, expressions
+
+    def _translate_expression(self, expression):
+        if isinstance(expression, Q):
+            clone = expression.copy()
+            clone.children = [
+                self._translate_lookup(*child) if isinstance(child, tuple) else self._translate_expression(child)
+                for child in expression.children
+            ]
+            return clone
+        if isinstance(expression, F):
+            return F(self._translate_name(expression.name))
+        if hasattr(expression, "get_source_expressions") and hasattr(expression, "copy"):
+            clone = expression.copy()
+            clone.set_source_expressions([
+                self._translate_expression(source) for source in expression.get_source_expressions()
+            ])
+            return clone
+        return expression
+
+
+class EntangledManager(Manager.from_queryset(EntangledQuerySet)):
+    """
+    Use this manager in models with JSON fields edited by entangled forms.
+    """
@@ -0,0 +1,79 @@
+from copy import copy, deepcopy
+
+from django.core.exceptions import ValidationError
+from django.forms.fields import FileField
+from django.forms.models import apply_limit_choices_to_to_formfield
+
+from .forms import EntangledModelFormMixin
+from .importers import _get_prefetched_field_class, prefetch_choices
+
+
+class EntangledValidator:
+    """
+    Validates dictionaries of data against the fields of an entangled form and packs them into the
+    layout of its JSON fields, without instantiating that form. The `clean()` method of each form field
+    is used as is, while the form's own `clean()` and `clean_<field>()` methods, as well as the model
+    validation, are not invoked. Disabled fields and file fields are ignored. As in forms, the choices of
+    model choice fields are restricted by `limit_choices_to`, which is evaluated once, when the validator
+    is created.
+    """
+    def __init__(self, form_class):
+        assert issubclass(form_class, EntangledModelFormMixin), "{} is not an entangled form".format(form_class)
+        opts = form_class._meta
+        self.form_class = form_class
+        self.json_fields = tuple(opts.entangled_fields.keys())
+        plans = {plan.name: plan for plan in opts.entangled_plan}
+        fields = []
+        for name, field in form_class.base_fields.items():
+            if name in self.json_fields or field.disabled or isinstance(field, FileField):
+                continue
+            if hasattr(field, 'get_limit_choices_to'):
+                # the declared fields are shared, hence restrict a copy, as forms do for each instance
+                field = deepcopy(field)
+                apply_limit_choices_to_to_formfield(field)
+            fields.append((name, field, plans.get(name), opts.entangled_codecs.get(name)))
+        self.fields = tuple(fields)
+
+    def validate(self, data):
+        """
+        Validates one dictionary of data. Returns a tuple containing the cleaned data, with the entangled
+        fields packed into their JSON fields, and a dictionary mapping field names onto their errors.
+        """
+        return self._validate(self.fields, data)
+
+    def validate_many(self, payloads):
+        """
+        Validates a list of dictionaries, fetching the objects referenced by model choice fields of all
+        of them using one query per distinct queryset. Returns a list of tuples as returned by `validate`.
+        """
+        payloads = list(payloads)
+        prefetched_choices = prefetch_choices(self.form_class, payloads)
+        fields = []
+        for name, field, plan, codec in self.fields:
+            if name in prefetched_choices:
+                prefetched_field = copy(field)
+                prefetched_field.__class__ = _get_prefetched_field_class(field.__class__)
+                prefetched_field.prefetched_objects = prefetched_choices[name]
+                field = prefetched_field
+            fields.append((name, field, plan, codec))
+        return [self._validate(fields, data) for data in payloads]
+
+    def _validate(self, fields, data):
+        cleaned_data = {field_name: {} for field_name in self.json_fields}
+        errors = {}
+        for name, field, plan, codec in fields:
+            try:
+                value = field.clean(data.get(name))
+            except ValidationError as error:
+                errors[name] = error.error_list
+                continue
+            if plan is None:
+                cleaned_data[name] = value
+                continue
+            value = plan.pack_value(value, field, self.form_class._meta.entangled_compact_references)
+            if codec and value is not None:
+                value = codec.encode(value)
+            plan.set_value(cleaned_data[plan.json_field], value)
+        if errors:
+            return None, errors
+        return cleaned_data, {}
@@ -1,4 +1,131 @@
+import asyncio
+from functools import lru_cache
+
 from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import NotSupportedError, connections, router, transaction
+from django.db.models import F, Model
+
+from .cache import get_reference_cache
+from .expressions import JSONBExtractPath, JSONBMerge, JSONBRemovePath
+
+
+@lru_cache(maxsize=None)
+def get_model(label):
+    """
+    Cached variant of `apps.get_model`.
+    """
+    return apps.get_model(label)
+
+
+@lru_cache(maxsize=None)
+def get_model_label(Model):
+    """
+    Returns the label of the given model, as stored inside references to its objects.
+    """
+    return Model._meta.label_lower
+
+
+_model_tokens = None
+
+
+def load_model_tokens():
+    """
+    Builds the resolution cache for compact references from setting `ENTANGLED_MODEL_TOKENS`, which maps
+    model labels onto short tokens. Invoked on startup, if this app is listed in `INSTALLED_APPS`,
+    otherwise on first use.
+    """
+    global _model_tokens
+    tokens = {label.lower(): token for label, token in getattr(settings, 'ENTANGLED_MODEL_TOKENS', {}).items()}
+    labels = {token: label for label, token in tokens.items()}
+    if len(labels) != len(tokens):
+        raise ImproperlyConfigured("The tokens in setting ENTANGLED_MODEL_TOKENS must be unique.")
+    for label in tokens.keys():
+        try:
+            get_model(label)
+        except (LookupError, ValueError):
+            raise ImproperlyConfigured("Setting ENTANGLED_MODEL_TOKENS refers to unknown model '{}'.".format(label))
+    _model_tokens = tokens, labels
+    return _model_tokens
+
+
+def get_model_token(label):
+    """
+    Returns the token representing the model with the given label inside compact references.
+    Models without a configured token are represented by their label.
+    """
+    tokens = _model_tokens or load_model_tokens()
+    return tokens[0].get(label, label)
+
+
+def get_reference_label(reference):
+    """
+    Returns the label of the model referenced by the content of a `ModelChoiceField` or
+    `ModelMultipleChoiceField`, stored either as `{"model": label, ...}` or in the compact form
+    `{"m": token, ...}`. Raises KeyError or TypeError for other content.
+    """
+    try:
+        return reference['model']
+    except KeyError:
+        token = reference['m']
+    tokens = _model_tokens or load_model_tokens()
+    return tokens[1].get(token, token)
+
+
+def fetch_related_objects(references):
+    """
+    Fetches the objects referenced by a mapping of model labels onto their primary keys.
+    Runs exactly one query per distinct model and returns a mapping of model labels onto
+    dictionaries, which themselves map the primary keys onto their related objects. Primary
+    keys referring to objects which do not exist (anymore), map onto None.
+    """
+    cache = get_reference_cache()
+    related_objects = {}
+    for label, p_keys in references.items():
+        Model = get_model(label)
+        related_objects[label] = dict.fromkeys(p_keys)
+        if cache is not None:
+            cached_objects, p_keys = cache.get_many(label, p_keys)
+            related_objects[label].update(cached_objects)
+        if p_keys:
+            fetched_objects = Model.objects.in_bulk(p_keys)
+            related_objects[label].update(fetched_objects)
+            if cache is not None:
+                cache.set_many(label, {pk: fetched_objects.get(pk) for pk in p_keys})
+    return related_objects
+
+
+async def afetch_related_objects(references):
+    """
+    Asynchronous variant of `fetch_related_objects`, querying the models concurrently.
+    """
+    cache = get_reference_cache()
+    related_objects, missing = {}, {}
+    for label, p_keys in references.items():
+        related_objects[label] = dict.fromkeys(p_keys)
+        if cache is not None:
+            cached_objects, p_keys = cache.get_many(label, p_keys)
+            related_objects[label].update(cached_objects)
+        if p_keys:
+            missing[label] = p_keys
+    results = await asyncio.gather(*(get_model(label).objects.ain_bulk(p_keys) for label, p_keys in missing.items()))
+    for (label, p_keys), fetched_objects in zip(missing.items(), results):
+        related_objects[label].update(fetched_objects)
+        if cache is not None:
+            cache.set_many(label, {pk: fetched_objects.get(pk) for pk in p_keys})
+    return related_objects
+
+
+def normalize_pk(label, pk):
+    """
+    Converts a primary key read from JSON into the Python type used by the referenced model.
+    Returns None if the given value is not a valid primary key for that model.
+    """
+    try:
+        return get_model(label)._meta.pk.to_python(pk)
+    except (TypeError, ValidationError):
+        return None
 
 
 def get_related_object(scope, field_name):
@@ -6,8 +133,9 @@ def get_related_object(scope, field_name):
     Returns the related field, referenced by the content of a ModelChoiceField.
     """
     try:
-        Model = apps.get_model(scope[field_name]['model'])
-        relobj = Model.objects.get(pk=scope[field_name]['pk'])
+        label = get_reference_label(scope[field_name])
+        pk = normalize_pk(label, scope[field_name]['pk'])
+        relobj = fetch_related_objects({label: {pk}})[label][pk] if pk is not None else None
     except:
         relobj = None
     return relobj
@@ -18,8 +146,243 @@ def get_related_queryset(scope, field_name):
     Returns the related queryset, referenced by the content of a ModelChoiceField.
     """
     try:
-        Model = apps.get_model(scope[field_name]['model'])
+        Model = get_model(get_reference_label(scope[field_name]))
         queryset = Model.objects.filter(pk__in=scope[field_name]['p_keys'])
     except:
         queryset = None
     return queryset
+
+
+def _get_reference(scope, field_name):
+    parts = field_name.split('.')
+    if isinstance(scope, Model):
+        scope = getattr(scope, parts.pop(0))
+    for part in parts:
+        scope = scope[part]
+    return scope
+
+
+def _get_references(scopes, field_name, key):
+    references = {}
+    entries = []
+    for scope in scopes:
+        try:
+            reference = _get_reference(scope, field_name)
+            label, value = get_reference_label(reference), reference[key]
+            if key == 'p_keys':
+                value = [normalize_pk(label, pk) for pk in value]
+                references.setdefault(label, set()).update(pk for pk in value if pk is not None)
+            else:
+                value = normalize_pk(label, value)
+                if value is not None:
+                    references.setdefault(label, set()).add(value)
+        except (AttributeError, KeyError, LookupError, TypeError, ValueError):
+            entries.append(None)
+        else:
+            entries.append((label, value) if value is not None else None)
+    return entries, fetch_related_objects(references)
+
+
+def get_related_objects(scopes, field_name):
+    """
+    Bulk variant of `get_related_object`. Each scope is either a dictionary or a model instance,
+    in which case `field_name` must be prefixed by the name of its JSON field, for instance
+    `properties.tenant`. Nested entries are addressed by dotted paths. Returns a list containing
+    the related object or None for each scope, running one query per referenced model.
+    """
+    entries, related_objects = _get_references(scopes, field_name, 'pk')
+    return [related_objects[entry[0]].get(entry[1]) if entry else None for entry in entries]
+
+
+def get_related_object_lists(scopes, field_name):
+    """
+    Bulk variant of `get_related_queryset`. Scopes and field names are handled the same way as in
+    `get_related_objects`. Returns a list containing the list of related objects or None for each
+    scope, running one query per referenced model.
+    """
+    entries, related_objects = _get_references(scopes, field_name, 'p_keys')
+    result = []
+    for entry in entries:
+        if entry:
+            objects = related_objects[entry[0]]
+            result.append([objects[pk] for pk in entry[1] if objects.get(pk) is not None])
+        else:
+            result.append(None)
+    return result
+
+
+def update_json_paths(instance, field_name, values):
+    """
+    Writes the given values into the JSON field `field_name` of an already saved instance, without
+    rewriting the other content of that field. The values are given as a mapping of paths, ie. tuples
+    of keys, onto their new content. On PostgreSQL this is performed by a single key-level UPDATE;
+    on other database backends the stored JSON is reloaded, patched and written back as a whole.
+    """
+    if not values:
+        return
+    Model = instance.__class__
+    using = router.db_for_write(Model, instance=instance)
+    queryset = Model._base_manager.using(using).filter(pk=instance.pk)
+    encoder = instance._meta.get_field(field_name).encoder
+    if connections[using].vendor == 'postgresql':
+        queryset.update(**{field_name: JSONBMerge(field_name, values, encoder=encoder)})
+        return
+    with transaction.atomic(using=using):
+        data = queryset.select_for_update().values_list(field_name, flat=True).first()
+        if not isinstance(data, dict):
+            data = {}
+        for path, value in values.items():
+            bucket = data
+            for part in path[:-1]:
+                if not isinstance(bucket.get(part), dict):
+                    bucket[part] = {}
+                bucket = bucket[part]
+            bucket[path[-1]] = value
+        queryset.update(**{field_name: data})
+    setattr(instance, field_name, data)
+
+
+def backfill_mirrored_fields(form_class, queryset=None, batch_size=1000):
+    """
+    Copies the values of all entangled fields listed in `Meta.mirrored_fields` of the given form class
+    from their JSON fields into their mirrored model fields. Rows are processed in batches of
+    `batch_size` and written using `bulk_update`. Returns the number of processed rows.
+    """
+    from .forms import EntangledFieldPlan
+
+    opts = form_class._meta
+    if queryset is None:
+        queryset = opts.model._default_manager.all()
+    plans = [plan for plan in opts.entangled_plan if plan.name in opts.mirrored_fields]
+    if not plans:
+        return 0
+    model_fields = [opts.model._meta.get_field(opts.mirrored_fields[plan.name]) for plan in plans]
+    field_names = [model_field.name for model_field in model_fields]
+    manager = queryset.model._base_manager.db_manager(queryset.db)
+    count = 0
+    batch = []
+    for instance in queryset.iterator(chunk_size=batch_size):
+        for plan, model_field in zip(plans, model_fields):
+            try:
+                value = plan.get_value(getattr(instance, plan.json_field))
+            except (KeyError, TypeError):
+                value = None
+            if plan.kind == EntangledFieldPlan.OBJECT:
+                value = value.get('pk') if isinstance(value, dict) else None
+            setattr(instance, model_field.attname, value)
+        batch.append(instance)
+        if len(batch) >= batch_size:
+            manager.bulk_update(batch, field_names)
+            count += len(batch)
+            batch = []
+    if batch:
+        manager.bulk_update(batch, field_names)
+        count += len(batch)
+    return count
+
+
+def relayout_json_field(queryset, field_name, old_layout, new_layout, batch_size=1000, start_after=None,
+                        progress=None, use_sql=False):
+    """
+    Moves the values stored in the JSON field `field_name` of all objects in `queryset` from an old
+    onto a new layout. Both layouts map the names of entangled fields onto the dotted paths they are
+    stored at, as declared by `Meta.retangled_fields`; fields whose path did not change are left alone.
+    Objects are streamed in the order of their primary key and rewritten in batches of `batch_size`
+    using `bulk_update`. After each batch, the optional callable `progress` is invoked with the number
+    of processed and rewritten objects and the primary key of the last processed object, which can be
+    passed as `start_after` to resume an interrupted run. If `use_sql` is set, the values are moved
+    by one UPDATE statement per field instead, without loading any objects (PostgreSQL only); then
+    `progress` is invoked after each statement. Returns the number of rewritten objects, or in SQL
+    mode, the number of rows updated by all statements.
+    """
+    moves = _get_layout_moves(old_layout, new_layout)
+    queryset = queryset.order_by('pk')
+    if start_after is not None:
+        queryset = queryset.filter(pk__gt=start_after)
+    if not moves:
+        return 0
+    if use_sql:
+        return _relayout_json_field_sql(queryset, field_name, moves, progress)
+
+    manager = queryset.model._base_manager.db_manager(queryset.db)
+    processed, count, last_pk = 0, 0, start_after
+    batch = []
+    for instance in queryset.iterator(chunk_size=batch_size):
+        data = getattr(instance, field_name)
+        if isinstance(data, dict) and _move_paths(data, moves):
+            batch.append(instance)
+        processed += 1
+        last_pk = instance.pk
+        if processed % batch_size == 0:
+            if batch:
+                manager.bulk_update(batch, [field_name])
+                count += len(batch)
+                batch = []
+            if progress:
+                progress(processed, count, last_pk)
+    if batch:
+        manager.bulk_update(batch, [field_name])
+        count += len(batch)
+    if progress and processed % batch_size:
+        progress(processed, count, last_pk)
+    return count
+
+
+def _get_layout_moves(old_layout, new_layout):
+    moves = [
+        (tuple(old_path.split('.')), tuple(new_layout[name].split('.')))
+        for name, old_path in old_layout.items()
+        if name in new_layout and new_layout[name] != old_path
+    ]
+    # unchanged paths must be checked as well, since moving a field into them would overwrite their values
+    new_paths = [tuple(new_path.split('.')) for new_path in new_layout.values()]
+    for index, path in enumerate(new_paths):
+        for other in new_paths[index + 1:]:
+            if path[:len(other)] == other[:len(path)]:
+                raise ValueError("Path {} overlaps with path {}".format(".".join(path), ".".join(other)))
+    return moves
+
+
+def _move_paths(data, moves):
+    values = []
+    for old_path, new_path in moves:
+        bucket = data
+        try:
+            for part in old_path[:-1]:
+                bucket = bucket[part]
+            values.append((new_path, bucket.pop(old_path[-1])))
+        except (AttributeError, KeyError, TypeError):
+            continue
+    for path, value in values:
+        bucket = data
+        for part in path[:-1]:
+            if not isinstance(bucket.get(part), dict):
+                bucket[part] = {}
+            bucket = bucket[part]
+        bucket[path[-1]] = value
+    return bool(values)
+
+
+def _relayout_json_field_sql(queryset, field_name, moves, progress):
+    if connections[queryset.db].vendor != 'postgresql':
+        raise NotSupportedError("Relayouting JSON fields by SQL is only supported on PostgreSQL.")
+    # fields are moved one after another, hence no field may be moved onto the old path of another one
+    for old_path, _ in moves:
+        for other_path, new_path in moves:
+            if other_path != old_path and old_path[:len(new_path)] == new_path[:len(old_path)]:
+                raise ValueError("Path {} overlaps with path {}, move these fields in Python.".format(
+                    ".".join(old_path), ".".join(new_path)
+                ))
+    encoder = queryset.model._meta.get_field(field_name).encoder
+    count = 0
+    for old_path, new_path in moves:
+        expression = JSONBMerge(
+            JSONBRemovePath(F(field_name), old_path),
+            {new_path: JSONBExtractPath(F(field_name), old_path)},
+            encoder=encoder,
+        )
+        lookup = '__'.join((field_name,) + old_path + ('isnull',))
+        count += queryset.filter(**{lookup: False}).update(**{field_name: expression})
+        if progress:
+            progress(count, count, None)
+    return count
@@ -1,4 +1,8 @@
-from django.db.models import CharField, JSONField, Model
+from django.conf import settings
+from django.db.models import SET_NULL, CharField, DateTimeField, ForeignKey, JSONField, Model
+
+from entangled.accessors import EntangledAccessor
+from entangled.query import EntangledManager
 
 
 class Category(Model):
@@ -18,3 +22,16 @@ class Product(Model):
     )
     dummy_field = CharField(max_length=42, blank=True, null=True)
     properties = JSONField()
+
+    objects = EntangledManager()
+    entangled = EntangledAccessor('tests.test_accessors.ProductForm')
+
+
+class Book(Model):
+    title = CharField(max_length=50)
+    author = ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=SET_NULL)
+    isbn = CharField(max_length=13, unique=True, blank=True, null=True)
+    properties = JSONField(default=dict)
+    modified_at = DateTimeField(auto_now=True)
+
+    objects = EntangledManager()
@@ -48,4 +48,8 @@ INSTALLED_APPS = [
     'tests',
 ]
 
-USE_TZ = False
\ No newline at end of file
+USE_TZ = False
+ENTANGLED_MODEL_TOKENS = {
+    'auth.user': 'u',
+    'tests.category': 'c',
+}
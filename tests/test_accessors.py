@@ -0,0 +1,64 @@
+from datetime import date
+
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.forms import fields
+from django.forms.models import ModelChoiceField, ModelMultipleChoiceField
+
+from entangled.forms import EntangledModelForm
+from .models import Category, Product
+
+
+class ProductForm(EntangledModelForm):
+    tenant = ModelChoiceField(queryset=get_user_model().objects.all())
+    color = fields.CharField()
+    launch = fields.DateField()
+    weight = fields.DecimalField(required=False)
+    categories = ModelMultipleChoiceField(queryset=Category.objects.all(), required=False)
+
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['tenant', 'color', 'launch', 'weight', 'categories']}
+        retangled_fields = {'color': 'variants.color', 'tenant': 'ownership.tenant'}
+
+
+@pytest.fixture
+def products():
+    for k in range(3):
+        Product.objects.create(name=f"Product {k}", properties={
+            'ownership': {'tenant': {'model': 'auth.user', 'pk': 1 + k % 2}},
+            'variants': {'color': "red"},
+            'launch': "2024-03-0{}".format(k + 1),
+            'categories': {'model': 'tests.category', 'p_keys': [2, 1]},
+        })
+    return Product.objects.all()
+
+
+@pytest.mark.django_db
+def test_entangled_accessor(products, django_assert_num_queries):
+    product = products.first()
+    with django_assert_num_queries(0):
+        assert product.entangled.color == "red"
+        assert product.entangled.launch == date(2024, 3, 1)
+        assert product.entangled.weight is None
+    with django_assert_num_queries(2):
+        assert product.entangled.tenant.username == "John"
+        assert [c.identifier for c in product.entangled.categories] == ["Detergents", "Paraphernalia"]
+    assert product.entangled is product.entangled
+    with pytest.raises(AttributeError):
+        product.entangled.name
+    del product.entangled
+    assert product.entangled.launch == date(2024, 3, 1)
+
+
+@pytest.mark.django_db
+def test_prefetch_entangled(products, django_assert_num_queries):
+    with django_assert_num_queries(3):
+        products = list(Product.objects.prefetch_entangled('entangled').all())
+    with django_assert_num_queries(0):
+        assert [product.entangled.tenant.username for product in products] == ["John", "Mary", "John"]
+    products = Product.entangled.prefetch(Product.objects.all())
+    with django_assert_num_queries(0):
+        assert len(products[2].entangled.categories) == 2
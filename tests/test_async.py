@@ -0,0 +1,37 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from .models import Product
+from .test_entangled import ProductForm
+
+
+@pytest.mark.django_db
+def test_async_form(django_assert_num_queries):
+    instance = Product.objects.create(name="Colibri", properties={
+        'active': True,
+        'tenant': {'model': 'auth.user', 'pk': 2},
+        'categories': {'model': 'tests.category', 'p_keys': [1, 2]},
+    })
+
+    async def edit_product():
+        product_form = await ProductForm.acreate(instance=instance)
+        assert product_form.initial['tenant'].username == "Mary"
+        assert [c.identifier for c in product_form.initial['categories']] == ["Paraphernalia", "Detergents"]
+        product_form = await ProductForm.acreate(
+            data={'name': "Colibri", 'active': True, 'tenant': 1, 'categories': [2]}, instance=instance,
+        )
+        assert await product_form.ais_valid()
+        return await product_form.asave()
+
+    with django_assert_num_queries(7):
+        instance = async_to_sync(edit_product)()
+    instance.refresh_from_db()
+    assert instance.properties['tenant'] == {'model': 'auth.user', 'pk': 1}
+    assert instance.properties['categories'] == {'model': 'tests.category', 'p_keys': [2]}
+
+
+@pytest.mark.django_db
+def test_async_prefetch():
+    instance = Product.objects.create(name="Colibri", properties={'tenant': {'model': 'auth.user', 'pk': 1}})
+    related_objects = async_to_sync(ProductForm.aprefetch_related_objects)([instance])
+    assert related_objects['auth.user'][1].username == "John"
@@ -0,0 +1,69 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from entangled.cache import ReferenceCache, ReferenceCacheMiddleware, get_reference_cache, reference_cache
+from entangled.utils import fetch_related_objects, get_related_object
+from .models import Product
+from .test_entangled import ProductForm
+
+
+@pytest.mark.django_db
+def test_reference_cache(django_assert_num_queries):
+    properties = {
+        'tenant': {'model': 'auth.user', 'pk': 2},
+        'categories': {'model': 'tests.category', 'p_keys': [1, 2]},
+    }
+    instances = [Product.objects.create(name=name, properties=properties) for name in ("Colibri", "Hummingbird")]
+    assert get_reference_cache() is None
+    with reference_cache() as cache:
+        assert get_reference_cache() is cache
+        with django_assert_num_queries(2):
+            product_form = ProductForm(instance=instances[0])
+        assert product_form.initial['tenant'].username == "Mary"
+        with django_assert_num_queries(0):
+            product_form = ProductForm(instance=instances[1])
+            assert get_related_object(instances[1].properties, 'tenant').username == "Mary"
+        assert [c.identifier for c in product_form.initial['categories']] == ["Paraphernalia", "Detergents"]
+
+        mary = get_user_model().objects.get(pk=2)
+        mary.username = "Maria"
+        mary.save()
+        with django_assert_num_queries(1):
+            product_form = ProductForm(instance=instances[0])
+        assert product_form.initial['tenant'].username == "Maria"
+    assert get_reference_cache() is None
+
+
+@pytest.mark.django_db
+def test_reference_cache_eviction():
+    cache = ReferenceCache(maxsize=2)
+    cache.set_many('auth.user', {1: "John", 2: "Mary"})
+    assert cache.get_many('auth.user', {1}) == ({1: "John"}, set())
+    cache.set_many('tests.category', {1: None})
+    assert len(cache) == 2
+    assert cache.get_many('auth.user', {1, 2}) == ({1: "John"}, {2})
+    assert cache.get_many('tests.category', {1}) == ({1: None}, set())
+
+
+@pytest.mark.django_db
+def test_reference_cache_middleware(django_assert_num_queries):
+    def get_response(request):
+        with django_assert_num_queries(1):
+            assert fetch_related_objects({'auth.user': {1, 3}}) == {'auth.user': {1: request.user, 3: None}}
+            assert fetch_related_objects({'auth.user': {1, 3}}) == {'auth.user': {1: request.user, 3: None}}
+        return HttpResponse()
+
+    request = RequestFactory().get('/')
+    request.user = get_user_model().objects.get(pk=1)
+    ReferenceCacheMiddleware(get_response)(request)
+    assert get_reference_cache() is None
+
+    async def aget_response(request):
+        assert get_reference_cache() is not None
+        return HttpResponse()
+
+    assert async_to_sync(ReferenceCacheMiddleware(aget_response))(request).status_code == 200
@@ -0,0 +1,123 @@
+import json
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from django.forms import fields
+
+from entangled.codecs import Codec, EntangledJSONDecoder, EntangledJSONEncoder, register_codec
+from entangled.forms import EntangledModelForm
+from .models import Product
+
+
+class EventForm(EntangledModelForm):
+    start = fields.DateTimeField()
+    day = fields.DateField()
+    price = fields.DecimalField(max_digits=6, decimal_places=2)
+    ident = fields.UUIDField()
+    duration = fields.DurationField()
+
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['start', 'day', 'price', 'ident', 'duration']}
+        retangled_fields = {'day': 'dates.day'}
+
+
+@pytest.mark.django_db
+def test_codecs():
+    data = {
+        'name': "Concert", 'start': "2024-03-01 20:15", 'day': "2024-03-01", 'price': "12.50",
+        'ident': "12345678-1234-5678-1234-567812345678", 'duration': "02:30:00",
+    }
+    event_form = EventForm(data=data)
+    assert event_form.is_valid()
+    instance = event_form.save()
+    instance.refresh_from_db()
+    assert instance.properties == {
+        'start': "2024-03-01T20:15:00",
+        'dates': {'day': "2024-03-01"},
+        'price': "12.50",
+        'ident': "12345678-1234-5678-1234-567812345678",
+        'duration': "P0DT02H30M00S",
+    }
+
+    event_form = EventForm(instance=instance)
+    assert event_form.initial == {
+        'name': "Concert",
+        'properties': instance.properties,
+        'start': datetime(2024, 3, 1, 20, 15),
+        'day': date(2024, 3, 1),
+        'price': Decimal("12.50"),
+        'ident': uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        'duration': timedelta(hours=2, minutes=30),
+    }
+    event_form = EventForm(data=data, instance=instance)
+    assert event_form.is_valid()
+    assert event_form.changed_entangled_paths == set()
+
+
+@pytest.mark.django_db
+def test_codec_lookups():
+    data = {
+        'name': "Concert", 'start': "2024-03-01 20:15", 'day': "2024-03-01", 'price': "12.50",
+        'ident': "12345678-1234-5678-1234-567812345678", 'duration': "02:30:00",
+    }
+    event_form = EventForm(data=data)
+    assert event_form.is_valid()
+    instance = event_form.save()
+    queryset = Product.objects.entangled(EventForm)
+    assert queryset.filter(day=date(2024, 3, 1)).get() == instance
+    assert queryset.filter(day__in=[date(2024, 3, 1), date(2024, 3, 2)]).get() == instance
+    assert queryset.filter(start__gte=datetime(2024, 3, 1), start__lt=datetime(2024, 3, 2)).get() == instance
+    assert queryset.filter(day__gt=date(2024, 3, 1)).exists() is False
+    assert queryset.filter(price=Decimal("12.50")).get() == instance
+    assert queryset.filter(ident=uuid.UUID("12345678-1234-5678-1234-567812345678")).get() == instance
+    assert queryset.filter(duration=timedelta(hours=2, minutes=30)).get() == instance
+
+
+class Percent:
+    def __init__(self, value):
+        self.value = value
+
+
+class PercentCodec(Codec):
+    def encode(self, value):
+        return value.value / 100
+
+    def decode(self, value):
+        return Percent(round(value * 100))
+
+
+class PercentField(fields.IntegerField):
+    def clean(self, value):
+        return Percent(super().clean(value))
+
+
+@pytest.mark.django_db
+def test_register_codec():
+    register_codec(PercentField, PercentCodec())
+
+    class DiscountForm(EntangledModelForm):
+        discount = PercentField()
+
+        class Meta:
+            model = Product
+            entangled_fields = {'properties': ['discount']}
+
+    discount_form = DiscountForm(data={'discount': "15"})
+    assert discount_form.is_valid()
+    assert discount_form.cleaned_data['properties'] == {'discount': 0.15}
+    assert DiscountForm(instance=Product(properties={'discount': 0.15})).initial['discount'].value == 15
+    assert DiscountForm(instance=Product(properties={'discount': "n/a"})).initial['discount'] == "n/a"
+
+
+@pytest.mark.django_db
+def test_json_encoder():
+    value = {'day': date(2024, 3, 1), 'price': Decimal("1.5"), 'big': 2 ** 70, 1: "int key"}
+    encoded = json.dumps(value, cls=EntangledJSONEncoder)
+    assert json.loads(encoded, cls=EntangledJSONDecoder) == {
+        'day': "2024-03-01", 'price': "1.5", 'big': 2 ** 70, '1': "int key",
+    }
@@ -0,0 +1,61 @@
+import importlib
+import sys
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from . import test_retangled  # noqa: F401 registers the entangled forms used below
+
+
+@pytest.mark.django_db
+def test_makeentangledindexes():
+    out = StringIO()
+    call_command('makeentangledindexes', 'tests', fields=['color', 'tenant'], gin=True, dry_run=True, stdout=out)
+    output = out.getvalue()
+    assert "Migration for 'tests':" in output
+    assert "models.Index(models.F('properties__extra__variants__color'), name=" in output
+    assert "models.Index(models.F('properties__ownership__tenant__pk'), name=" in output
+    assert "django.contrib.postgres.indexes.GinIndex(fields=['properties']" in output
+    assert "Unindexed: tests.Product properties.extra.variants.size (form field 'size')" in output
+    assert "Unindexed: tests.Product properties.extra.categories (form field 'categories')" in output
+
+    out = StringIO()
+    call_command('makeentangledindexes', 'tests', fields=['categories'], gin=True, dry_run=True, stdout=out)
+    output = out.getvalue()
+    assert (
+        "django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass("
+        "models.F('properties__extra__categories__p_keys'), name='jsonb_path_ops'), name="
+    ) in output
+    assert "Unindexed: tests.Product properties.extra.categories" not in output
+
+
+@pytest.mark.django_db
+def test_makeentangledindexes_report():
+    out = StringIO()
+    call_command('makeentangledindexes', 'tests', dry_run=True, stdout=out)
+    output = out.getvalue()
+    assert "Migration for" not in output
+    assert "Unindexed: tests.Product properties.extra.categories (form field 'categories')" in output
+
+
+@pytest.mark.django_db
+def test_makeentangledindexes_state(tmp_path, monkeypatch):
+    (tmp_path / 'entangled_migrations').mkdir()
+    (tmp_path / 'entangled_migrations' / '__init__.py').touch()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    with override_settings(MIGRATION_MODULES={'tests': 'entangled_migrations'}):
+        call_command('makemigrations', 'tests', stdout=StringIO())
+        out = StringIO()
+        call_command('makeentangledindexes', 'tests', fields=['color'], stdout=out)
+        assert "Created migration" in out.getvalue()
+        importlib.invalidate_caches()
+        # the indexes are added to the database only, hence the models do not differ from the migration state
+        call_command('makemigrations', 'tests', check=True, dry_run=True, stdout=StringIO())
+        out = StringIO()
+        call_command('makeentangledindexes', 'tests', fields=['color'], stdout=out)
+        assert "Created migration" not in out.getvalue()
+    for module_name in [name for name in sys.modules if name.startswith('entangled_migrations')]:
+        del sys.modules[module_name]
@@ -0,0 +1,68 @@
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from entangled.utils import get_related_objects, load_model_tokens
+from .models import Product
+from .test_entangled import ProductForm
+
+
+class CompactProductForm(ProductForm):
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['active', 'tenant', 'description', 'categories']}
+        entangled_compact_references = True
+
+
+@pytest.mark.django_db
+def test_compact_references():
+    data = {'name': "Colibri", 'active': True, 'tenant': 2, 'categories': [1, 2]}
+    product_form = CompactProductForm(data=data)
+    assert product_form.is_valid()
+    instance = product_form.save()
+    instance.refresh_from_db()
+    assert instance.properties == {
+        'active': True,
+        'tenant': {'m': 'u', 'pk': 2},
+        'description': "",
+        'categories': {'m': 'c', 'p_keys': [1, 2]},
+    }
+
+    product_form = CompactProductForm(instance=instance)
+    assert product_form.initial['tenant'].username == "Mary"
+    assert [c.identifier for c in product_form.initial['categories']] == ["Paraphernalia", "Detergents"]
+    product_form = CompactProductForm(data=data, instance=instance)
+    assert product_form.is_valid()
+    assert product_form.changed_entangled_paths == set()
+    assert get_related_objects([instance], 'properties.tenant')[0].username == "Mary"
+    assert Product.objects.entangled(CompactProductForm).filter(tenant=2).get() == instance
+
+
+@pytest.mark.django_db
+def test_read_verbose_references():
+    instance = Product.objects.create(name="Colibri", properties={
+        'tenant': {'model': 'auth.user', 'pk': 1},
+        'categories': {'model': 'tests.category', 'p_keys': [2]},
+    })
+    product_form = CompactProductForm(instance=instance)
+    assert product_form.initial['tenant'].username == "John"
+    data = {'name': "Colibri", 'active': True, 'tenant': 1, 'categories': [2]}
+    product_form = CompactProductForm(data=data, instance=instance)
+    assert product_form.is_valid()
+    assert product_form.cleaned_data['properties']['tenant'] == {'m': 'u', 'pk': 1}
+    assert 'properties.tenant' in product_form.changed_entangled_paths
+
+
+@pytest.mark.django_db
+def test_model_tokens_setting():
+    try:
+        with override_settings(ENTANGLED_MODEL_TOKENS={'auth.user': 'x', 'tests.category': 'x'}):
+            with pytest.raises(ImproperlyConfigured):
+                load_model_tokens()
+        with override_settings(ENTANGLED_MODEL_TOKENS={'tests.unknown': 'x'}):
+            with pytest.raises(ImproperlyConfigured):
+                load_model_tokens()
+    finally:
+        load_model_tokens()
@@ -236,3 +236,61 @@ def test_no_unlisted_fields():
     print(ProductForm.base_fields)
     print(80*"=")
 
+
+
+@pytest.mark.django_db
+def test_instance_form_queries(django_assert_num_queries):
+    class OwnedProductForm(ProductForm):
+        owner = ModelChoiceField(queryset=get_user_model().objects.all())
+
+        class Meta:
+            model = Product
+            entangled_fields = {'properties': ['owner']}
+
+    properties = {
+        'active': True,
+        'tenant': {'model': 'auth.user', 'pk': 1},
+        'owner': {'model': 'auth.user', 'pk': 2},
+        'categories': {'model': 'tests.category', 'p_keys': [2, 1]},
+    }
+    instance = Product.objects.create(name="Broom", properties=properties)
+    with django_assert_num_queries(2):
+        product_form = OwnedProductForm(instance=instance)
+    assert product_form.initial['tenant'].username == "John"
+    assert product_form.initial['owner'].username == "Mary"
+    assert [c.identifier for c in product_form.initial['categories']] == ["Detergents", "Paraphernalia"]
+
+
+@pytest.mark.django_db
+def test_get_related_objects(django_assert_num_queries):
+    from entangled.utils import get_related_objects, get_related_object_lists
+
+    instances = [
+        Product(properties={
+            'tenant': {'model': 'auth.user', 'pk': 2},
+            'categories': {'model': 'tests.category', 'p_keys': [2]},
+        }),
+        Product(properties={'tenant': {'model': 'auth.user', 'pk': 99}}),
+        Product(properties={
+            'tenant': {'model': 'auth.user', 'pk': 1},
+            'categories': {'model': 'tests.category', 'p_keys': [1, 2]},
+        }),
+    ]
+    with django_assert_num_queries(1):
+        tenants = get_related_objects(instances, 'properties.tenant')
+    assert [tenant and tenant.username for tenant in tenants] == ["Mary", None, "John"]
+    with django_assert_num_queries(1):
+        categories = get_related_object_lists([p.properties for p in instances], 'categories')
+    assert categories[1] is None
+    assert [c.identifier for c in categories[2]] == ["Paraphernalia", "Detergents"]
+    assert get_related_objects([{'extra': {'tenant': {'model': 'auth.user', 'pk': 1}}}], 'extra.tenant')[0].pk == 1
+
+
+@pytest.mark.django_db
+def test_clean_form_queries(django_assert_num_queries):
+    data = {'name': "Colander", 'active': True, 'tenant': 2, 'categories': [1, 2]}
+    product_form = ProductForm(data=data)
+    # one query to clean field `tenant` and one to clean field `categories`
+    with django_assert_num_queries(2):
+        assert product_form.is_valid()
+    assert product_form.cleaned_data['properties']['categories'] == {'model': 'tests.category', 'p_keys': [1, 2]}
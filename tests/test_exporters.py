@@ -0,0 +1,58 @@
+from io import StringIO
+
+import pytest
+
+from entangled.exporters import export_csv, export_ndjson, export_rows
+from .models import Product
+from .test_retangled import ProductForm
+
+
+@pytest.fixture
+def products():
+    for k in range(5):
+        Product.objects.create(name=f"Product {k}", properties={
+            'active': k != 3,
+            'extra': {
+                'variants': {'color': "red", 'size': "m"},
+                'categories': {'model': 'tests.category', 'p_keys': [1, 2][:1 + k % 2]},
+            },
+            'ownership': {'tenant': {'model': 'auth.user', 'pk': 1 + k % 2}},
+        })
+    Product.objects.create(name="Empty", properties={})
+    return Product.objects.order_by('pk')
+
+
+@pytest.mark.django_db
+def test_export_rows(products, django_assert_num_queries):
+    # per chunk: one query for all users and one for all categories
+    with django_assert_num_queries(1 + 3 * 2):
+        rows = list(export_rows(ProductForm, products, chunk_size=2))
+    assert len(rows) == 6
+    assert rows[1]['name'] == "Product 1"
+    assert rows[1]['tenant'].username == "Mary"
+    assert [c.identifier for c in rows[1]['categories']] == ["Paraphernalia", "Detergents"]
+    assert rows[5] == {
+        'name': "Empty", 'tenant': None, 'active': None, 'color': None, 'size': None, 'categories': None,
+    }
+
+
+@pytest.mark.django_db
+def test_export_csv(products):
+    fileobj = StringIO()
+    export_csv(ProductForm, fileobj, products)
+    lines = fileobj.getvalue().splitlines()
+    assert lines[0] == "name,tenant,active,color,size,categories"
+    assert lines[2] == 'Product 1,Mary,True,red,m,"Paraphernalia, Detergents"'
+    assert lines[6] == "Empty,,,,,"
+
+
+@pytest.mark.django_db
+def test_export_ndjson(products):
+    fileobj = StringIO()
+    export_ndjson(ProductForm, fileobj, products)
+    lines = fileobj.getvalue().splitlines()
+    assert len(lines) == 6
+    assert lines[0] == (
+        '{"name": "Product 0", "tenant": "John", "active": true, "color": "red", "size": "m", '
+        '"categories": ["Paraphernalia"]}'
+    )
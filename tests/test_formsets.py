@@ -0,0 +1,40 @@
+import pytest
+
+from django.forms import modelformset_factory
+
+from entangled.formsets import BaseEntangledModelFormSet
+from .models import Product
+from .test_entangled import ProductForm
+
+
+@pytest.fixture
+def products():
+    for k in range(5):
+        Product.objects.create(name=f"Product {k}", properties={
+            'active': True,
+            'tenant': {'model': 'auth.user', 'pk': 1 + k % 2},
+            'categories': {'model': 'tests.category', 'p_keys': [1, 2]},
+        })
+    return Product.objects.all()
+
+
+@pytest.mark.django_db
+def test_formset_prefetch(products, django_assert_num_queries):
+    ProductFormSet = modelformset_factory(Product, form=ProductForm, formset=BaseEntangledModelFormSet, extra=1)
+    formset = ProductFormSet(queryset=products)
+    with django_assert_num_queries(3):
+        forms = formset.forms
+    assert len(forms) == 6
+    assert [form.initial['tenant'].username for form in forms[:5]] == ["John", "Mary", "John", "Mary", "John"]
+    assert [c.identifier for c in forms[0].initial['categories']] == ["Paraphernalia", "Detergents"]
+    assert 'tenant' not in forms[5].initial
+
+
+@pytest.mark.django_db
+def test_formset_dangling_reference(products, django_assert_num_queries):
+    Product.objects.create(name="Orphan", properties={'tenant': {'model': 'auth.user', 'pk': 99}})
+    ProductFormSet = modelformset_factory(Product, form=ProductForm, formset=BaseEntangledModelFormSet, extra=0)
+    formset = ProductFormSet(queryset=products)
+    with django_assert_num_queries(3):
+        forms = formset.forms
+    assert 'tenant' not in forms[5].initial
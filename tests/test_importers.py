@@ -0,0 +1,138 @@
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.forms import fields
+from django.forms.models import ModelChoiceField
+
+from entangled.forms import EntangledModelForm
+from entangled.importers import import_rows, validate_rows
+from .models import Book, Product
+from .test_entangled import ProductForm
+from .test_mirrored import BookForm
+
+
+@pytest.mark.django_db
+def test_import_rows(django_assert_num_queries):
+    rows = (
+        {'name': f"Product {k}", 'active': True, 'tenant': 1 + k % 2, 'categories': [1, 2][:1 + k % 2]}
+        for k in range(25)
+    )
+    # per batch: one query for all users, one for all categories, one INSERT inside a savepoint
+    with django_assert_num_queries(3 * 5):
+        result = import_rows(ProductForm, rows, batch_size=10)
+    assert (result.created, result.updated, result.errors) == (25, 0, {})
+    product = Product.objects.get(name="Product 3")
+    assert product.properties == {
+        'active': True,
+        'tenant': {'model': 'auth.user', 'pk': 2},
+        'description': "",
+        'categories': {'model': 'tests.category', 'p_keys': [1, 2]},
+    }
+
+
+@pytest.mark.django_db
+def test_import_rows_errors():
+    rows = [
+        {'name': "Broom", 'active': True, 'tenant': 1},
+        {'name': "Brush", 'active': True, 'tenant': 99},
+        {'name': "Mop", 'active': True, 'tenant': 2, 'categories': [1, 7]},
+        {'active': True, 'tenant': 2},
+        {'name': "Rag", 'active': True, 'tenant': "1\x00"},
+    ]
+    result = import_rows(ProductForm, rows, batch_size=2)
+    assert result.created == 1
+    assert list(result.errors.keys()) == [1, 2, 3, 4]
+    assert result.errors[1]['tenant'] == [
+        "Select a valid choice. That choice is not one of the available choices."
+    ]
+    assert result.errors[2]['categories'] == ["Select a valid choice. 7 is not one of the available choices."]
+    assert list(result.errors[3].keys()) == ['name']
+    assert result.errors[4]['tenant'] == ["Null characters are not allowed."]
+
+
+@pytest.mark.django_db
+def test_import_rows_update():
+    book = Book.objects.create(title="Emma", isbn="9780141439587", properties={
+        'author': {'model': 'auth.user', 'pk': 1},
+        'identifiers': {'isbn': "9780141439587"},
+        'pages': 400,
+    })
+    rows = [
+        {'title': "Emma", 'author': 2, 'isbn': "9780141439587", 'pages': 474},
+        {'title': "Persuasion", 'author': 2, 'isbn': "9780141439686", 'pages': 249},
+    ]
+    result = import_rows(BookForm, rows, lookup_field='isbn')
+    assert (result.created, result.updated, result.errors) == (1, 1, {})
+    book.refresh_from_db()
+    assert book.author_id == 2
+    assert book.properties['pages'] == 474
+    assert Book.objects.get(isbn="9780141439686").properties['identifiers'] == {'isbn': "9780141439686"}
+
+
+class AllFieldsBookForm(EntangledModelForm):
+    title = fields.CharField()
+    isbn = fields.CharField()
+    pages = fields.IntegerField()
+
+    class Meta:
+        model = Book
+        fields = '__all__'
+        untangled_fields = ['title', 'isbn']
+        entangled_fields = {'properties': ['pages']}
+
+
+@pytest.mark.django_db
+def test_import_rows_update_all_fields():
+    book = Book.objects.create(title="Emma", isbn="9780141439587", properties={'pages': 400})
+    rows = [{'title': "Emma", 'isbn': "9780141439587", 'author': 2, 'pages': 474}]
+    result = import_rows(AllFieldsBookForm, rows, lookup_field='isbn')
+    assert (result.created, result.updated, result.errors) == (0, 1, {})
+    book.refresh_from_db()
+    assert book.author_id == 2
+    assert book.properties == {'pages': 474}
+
+
+class LimitedProductForm(ProductForm):
+    tenant = ModelChoiceField(
+        queryset=get_user_model().objects.all(), limit_choices_to={'username': "John"}, empty_label=None,
+    )
+
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['active', 'tenant', 'description', 'categories']}
+
+
+@pytest.mark.django_db
+def test_import_rows_limit_choices_to():
+    rows = [{'name': "Broom", 'active': True, 'tenant': 1}, {'name': "Brush", 'active': True, 'tenant': 2}]
+    assert LimitedProductForm(data=rows[1]).is_valid() is False
+    result = import_rows(LimitedProductForm, rows)
+    assert result.created == 1
+    assert list(result.errors.keys()) == [1]
+    assert Product.objects.get().name == "Broom"
+    results = validate_rows(LimitedProductForm, rows, processes=1)
+    assert results[0][1] == {}
+    assert results[1][1]['tenant'][0].code == 'invalid_choice'
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('processes', [1, 2])
+def test_validate_rows(processes, django_assert_num_queries):
+    rows = [
+        {'name': f"Product {k}", 'active': True, 'tenant': 1 + k % 3, 'categories': [1, 2][:1 + k % 2]}
+        for k in range(9)
+    ]
+    # one query for all users, one for all categories
+    with django_assert_num_queries(2):
+        results = validate_rows(ProductForm, rows, processes=processes, chunk_size=2)
+    assert len(results) == 9
+    for k, (cleaned_data, errors) in enumerate(results):
+        if k % 3 == 2:
+            assert cleaned_data is None
+            assert errors['tenant'][0].code == 'invalid_choice'
+        else:
+            assert errors == {}
+            assert cleaned_data['name'] == f"Product {k}"
+            assert cleaned_data['properties']['tenant'] == {'model': 'auth.user', 'pk': 1 + k % 3}
+            assert cleaned_data['properties']['categories']['p_keys'] == [1, 2][:1 + k % 2]
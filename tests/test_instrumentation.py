@@ -0,0 +1,52 @@
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.forms import fields
+from django.forms.models import ModelChoiceField
+
+from entangled import instrumentation
+from entangled.forms import EntangledModelForm
+from .models import Product
+
+
+class ProductForm(EntangledModelForm):
+    color = fields.CharField()
+    tenant = ModelChoiceField(queryset=get_user_model().objects.all())
+
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['color', 'tenant']}
+
+
+@pytest.fixture
+def reports():
+    reports = []
+    instrumentation.register_observer(reports.append)
+    yield reports
+    instrumentation.unregister_observer(reports.append)
+
+
+@pytest.mark.django_db
+def test_instrumentation(reports):
+    properties = {'color': "red", 'tenant': {'model': 'auth.user', 'pk': 1}}
+    instance = Product.objects.create(name="Shirt", properties=properties)
+    product_form = ProductForm(data={'name': "Shirt", 'color': "blue", 'tenant': 2}, instance=instance)
+    assert product_form.is_valid()
+    product_form.save()
+    assert [(report.form_class, report.phase) for report in reports] == [
+        (ProductForm, 'init'), (ProductForm, 'clean'), (ProductForm, 'save'),
+    ]
+    init, clean, save = reports
+    assert init.queries == 1 and init.references == 1 and init.field_count == 2
+    assert init.json_size == len(b'{"color": "red", "tenant": {"model": "auth.user", "pk": 1}}')
+    assert clean.queries == 1
+    assert clean.json_size == len(b'{"color": "blue", "tenant": {"model": "auth.user", "pk": 2}}')
+    assert save.queries == 1
+    assert all(report.duration > 0 for report in reports)
+
+
+@pytest.mark.django_db
+def test_without_observers():
+    assert instrumentation.observers == ()
+    assert instrumentation.measure(ProductForm, 'init').__enter__() is None
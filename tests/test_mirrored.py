@@ -0,0 +1,98 @@
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.forms import fields
+from django.forms.models import ModelChoiceField
+
+from entangled.forms import EntangledModelForm
+from entangled.utils import backfill_mirrored_fields
+from .models import Book
+
+
+class BookForm(EntangledModelForm):
+    title = fields.CharField()
+    author = ModelChoiceField(queryset=get_user_model().objects.all())
+    isbn = fields.CharField()
+    pages = fields.IntegerField()
+
+    class Meta:
+        model = Book
+        untangled_fields = ['title']
+        entangled_fields = {'properties': ['author', 'isbn', 'pages']}
+        retangled_fields = {'isbn': 'identifiers.isbn'}
+        mirrored_fields = ['author', 'isbn']
+        entangled_partial_update = True
+
+
+class RenamedBookForm(EntangledModelForm):
+    title = fields.CharField()
+    code = fields.CharField()
+    pages = fields.IntegerField()
+
+    class Meta:
+        model = Book
+        untangled_fields = ['title']
+        entangled_fields = {'properties': ['code', 'pages']}
+        mirrored_fields = {'code': 'isbn'}
+
+
+@pytest.mark.django_db
+def test_mirrored_fields():
+    book_form = BookForm(data={'title': "Emma", 'author': 2, 'isbn': "9780141439587", 'pages': 474})
+    assert book_form.is_valid()
+    book = book_form.save()
+    book.refresh_from_db()
+    assert book.properties == {
+        'author': {'model': 'auth.user', 'pk': 2},
+        'identifiers': {'isbn': "9780141439587"},
+        'pages': 474,
+    }
+    assert book.author.username == "Mary"
+    assert book.isbn == "9780141439587"
+
+    book_form = BookForm(data={'title': "Emma", 'author': 1, 'isbn': "9780141439587", 'pages': 474}, instance=book)
+    assert book_form.is_valid()
+    book_form.save()
+    book.refresh_from_db()
+    assert book.author_id == 1
+    assert book.properties['author']['pk'] == 1
+    assert Book.objects.filter(author__username="John").count() == 1
+
+
+@pytest.mark.django_db
+def test_mirrored_fields_validation():
+    Book.objects.create(title="Emma", isbn="9780141439587")
+    book_form = BookForm(data={'title': "Emma", 'author': 2, 'isbn': "9780141439587", 'pages': 474})
+    assert book_form.is_valid() is False
+    assert book_form.errors == {'isbn': ["Book with this Isbn already exists."]}
+
+    book_form = RenamedBookForm(data={'title': "Emma", 'code': "9780141439587", 'pages': 474})
+    assert book_form.is_valid() is False
+    assert book_form.errors == {'code': ["Book with this Isbn already exists."]}
+    book_form = RenamedBookForm(data={'title': "Emma", 'code': "97801414395870", 'pages': 474})
+    assert book_form.is_valid() is False
+    assert book_form.errors == {'code': ["Ensure this value has at most 13 characters (it has 14)."]}
+
+
+@pytest.mark.django_db
+def test_backfill_mirrored_fields():
+    for k in range(5):
+        Book.objects.create(title=f"Volume {k}", properties={
+            'author': {'model': 'auth.user', 'pk': 1 + k % 2},
+            'identifiers': {'isbn': f"97800000000{k}"},
+        })
+    Book.objects.create(title="Anonymous")
+    assert backfill_mirrored_fields(BookForm, batch_size=2) == 6
+    assert list(Book.objects.order_by('pk').values_list('author_id', 'isbn')) == [
+        (1, "978000000000"), (2, "978000000001"), (1, "978000000002"), (2, "978000000003"), (1, "978000000004"),
+        (None, None),
+    ]
+
+
+@pytest.mark.django_db
+def test_invalid_mirrored_fields():
+    with pytest.raises(AssertionError):
+        class InvalidBookForm(BookForm):
+            class Meta:
+                model = Book
+                mirrored_fields = ['title']
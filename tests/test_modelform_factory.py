@@ -2,6 +2,7 @@ import pytest
 
 from django.forms import modelform_factory
 
+from entangled.forms import entangled_modelform_factory
 from .models import Product
 from .test_inheritance import QuantifiedUnsortedProductForm
 
@@ -65,3 +66,22 @@ def test_modelform_exclude_entangled():
     for field in expected_fields:
         assert field in form.base_fields
 
+
+@pytest.mark.django_db
+def test_entangled_modelform_factory():
+    entangled_modelform_factory.cache_clear()
+    form = entangled_modelform_factory(
+        Product, form=QuantifiedUnsortedProductForm, fields=['dummy_field', 'active'], labels={'dummy_field': "Dummy"},
+    )
+    assert set(form.base_fields.keys()) == {'dummy_field', 'active', 'properties'}
+    assert form.base_fields['dummy_field'].label == "Dummy"
+    assert form is entangled_modelform_factory(
+        Product, form=QuantifiedUnsortedProductForm, fields=('dummy_field', 'active'), labels={'dummy_field': "Dummy"},
+    )
+    assert form is not entangled_modelform_factory(Product, form=QuantifiedUnsortedProductForm, fields=['name'])
+    assert entangled_modelform_factory.cache_info().hits == 1
+
+    # unhashable arguments bypass the cache
+    options = {'fields': ['name'], 'error_messages': {'name': {'required': {"unhashable"}}}}
+    assert entangled_modelform_factory(Product, form=QuantifiedUnsortedProductForm, **options) is not \
+        entangled_modelform_factory(Product, form=QuantifiedUnsortedProductForm, **options)
@@ -0,0 +1,196 @@
+import pytest
+
+from django.forms import fields
+
+from entangled.expressions import JSONBMerge
+from entangled.forms import EntangledModelForm
+from .models import Book, Product
+from .test_entangled import ProductForm
+from .test_mirrored import BookForm
+
+
+class ColorForm(EntangledModelForm):
+    color = fields.CharField()
+
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['color']}
+        retangled_fields = {'color': 'variants.color'}
+        entangled_partial_update = True
+
+
+class SizeForm(EntangledModelForm):
+    size = fields.CharField()
+
+    class Meta:
+        model = Product
+        entangled_fields = {'properties': ['size']}
+        retangled_fields = {'size': 'variants.size'}
+        entangled_partial_update = True
+
+
+@pytest.mark.django_db
+def test_disjoint_partial_updates():
+    properties = {'variants': {'color': "red", 'size': "s"}, 'weight': 3}
+    Product.objects.create(name="Shirt", properties=properties)
+    color_form = ColorForm(data={'name': "T-Shirt", 'color': "blue"}, instance=Product.objects.get())
+    size_form = SizeForm(data={'size': "m"}, instance=Product.objects.get())
+    assert color_form.is_valid() and size_form.is_valid()
+    color_form.save()
+    size_form.save()
+    instance = Product.objects.get()
+    assert instance.name == "T-Shirt"
+    assert instance.properties == {'variants': {'color': "blue", 'size': "m"}, 'weight': 3}
+
+
+@pytest.mark.django_db
+def test_partial_update_creates_instance():
+    color_form = ColorForm(data={'name': "Shirt", 'color': "blue"})
+    assert color_form.is_valid()
+    instance = color_form.save()
+    instance.refresh_from_db()
+    assert instance.properties == {'variants': {'color': "blue"}}
+
+
+@pytest.mark.django_db
+def test_inherited_partial_update_option():
+    class ColorSizeForm(ColorForm):
+        size = fields.CharField()
+
+        class Meta:
+            model = Product
+            entangled_fields = {'properties': ['size']}
+
+    assert ColorSizeForm._meta.entangled_partial_update is True
+
+
+class PostgresCompiler:
+    def compile(self, expression):
+        return '"tests_product"."properties"', []
+
+
+@pytest.mark.django_db
+def test_jsonb_merge_sql():
+    expression = JSONBMerge('properties', {('variants', 'color'): "blue", ('weight',): 3})
+    sql, params = expression.as_postgresql(PostgresCompiler(), None)
+    assert sql == (
+        "(CASE WHEN jsonb_typeof(\"tests_product\".\"properties\") = 'object' "
+        "THEN \"tests_product\".\"properties\" ELSE '{}'::jsonb END || jsonb_build_object("
+        "%s::text, (CASE WHEN jsonb_typeof((\"tests_product\".\"properties\" #> %s::text[])) = 'object' "
+        "THEN (\"tests_product\".\"properties\" #> %s::text[]) ELSE '{}'::jsonb END || "
+        "jsonb_build_object(%s::text, %s::jsonb)), %s::text, %s::jsonb))"
+    )
+    assert params == ['variants', ['variants'], ['variants'], 'color', '"blue"', 'weight', '3']
+
+
+@pytest.mark.django_db
+def test_changed_entangled_paths(django_assert_num_queries):
+    instance = Product.objects.create(name="Shirt", properties={'variants': {'color': "red"}})
+    color_form = ColorForm(data={'name': "Shirt", 'color': "red"}, instance=instance)
+    assert color_form.is_valid()
+    assert color_form.changed_entangled_paths == set()
+    with django_assert_num_queries(0):
+        color_form.save()
+
+    color_form = ColorForm(data={'name': "Shirt", 'color': "blue"}, instance=instance)
+    assert color_form.is_valid()
+    assert color_form.changed_entangled_paths == {'properties.variants.color'}
+    color_form.save()
+    assert Product.objects.get().properties == {'variants': {'color': "blue"}}
+
+
+@pytest.mark.django_db
+def test_save_only_changed_fields(django_assert_num_queries):
+    instance = Product.objects.create(name="Shirt", properties={
+        'active': True,
+        'tenant': {'model': 'auth.user', 'pk': 1},
+        'description': "",
+        'categories': {'model': 'tests.category', 'p_keys': []},
+    })
+    data = {'name': "Shirt", 'active': True, 'tenant': 1}
+    product_form = ProductForm(data=data, instance=instance)
+    assert product_form.is_valid()
+    with django_assert_num_queries(0):
+        product_form.save()
+
+    product_form = ProductForm(data=dict(data, name="T-Shirt"), instance=instance)
+    assert product_form.is_valid()
+    with django_assert_num_queries(1) as context:
+        product_form.save()
+    assert '"properties"' not in context.captured_queries[0]['sql']
+
+    product_form = ProductForm(data=dict(data, name="T-Shirt", tenant=2), instance=instance)
+    assert product_form.is_valid()
+    instance.dummy_field = "changed"
+    with django_assert_num_queries(1) as context:
+        product_form.save()
+    assert '"properties"' in context.captured_queries[0]['sql']
+    instance = Product.objects.get()
+    assert instance.name == "T-Shirt"
+    assert instance.dummy_field == "changed"
+    assert instance.properties['tenant'] == {'model': 'auth.user', 'pk': 2}
+
+    # changes applied before creating the form are saved as well
+    instance.dummy_field = "changed again"
+    product_form = ProductForm(data=dict(data, name="Shirt", tenant=2), instance=instance)
+    assert product_form.is_valid()
+    product_form.save()
+    assert Product.objects.values_list('name', 'dummy_field').get() == ("Shirt", "changed again")
+
+
+@pytest.mark.django_db
+def test_save_deleted_instance():
+    instance = Product.objects.create(name="Shirt", properties={
+        'active': True,
+        'tenant': {'model': 'auth.user', 'pk': 1},
+        'description': "",
+        'categories': {'model': 'tests.category', 'p_keys': []},
+    })
+    product_form = ProductForm(data={'name': "T-Shirt", 'active': True, 'tenant': 1}, instance=instance)
+    assert product_form.is_valid()
+    Product.objects.all().delete()
+    product_form.save()
+    instance = Product.objects.get()
+    assert instance.name == "T-Shirt"
+    assert instance.properties['tenant'] == {'model': 'auth.user', 'pk': 1}
+
+
+@pytest.mark.django_db
+def test_partial_update_instance_changes(django_assert_num_queries):
+    book = Book.objects.create(title="Emma", properties={'pages': 400})
+    modified_at = book.modified_at
+    data = {'title': "Emma", 'author': 1, 'isbn': "9780141439587", 'pages': 400}
+    book_form = BookForm(data=data, instance=book)
+    assert book_form.is_valid()
+    book_form.save()
+    book.refresh_from_db()
+    assert (book.author_id, book.isbn) == (1, "9780141439587")
+    assert book.modified_at > modified_at
+
+    # attributes assigned to the instance after validation are written, even if the form did not change
+    book_form = BookForm(data=data, instance=book)
+    assert book_form.is_valid()
+    book_form.instance.title = "Emma: A Novel"
+    book_form.save()
+    assert Book.objects.get().title == "Emma: A Novel"
+
+    book_form = BookForm(data=dict(data, title="Emma: A Novel"), instance=book)
+    assert book_form.is_valid()
+    with django_assert_num_queries(0):
+        book_form.save()
+
+
+@pytest.mark.django_db
+def test_save_instance_changes():
+    instance = Product.objects.create(name="Shirt", properties={
+        'active': True,
+        'tenant': {'model': 'auth.user', 'pk': 1},
+        'description': "",
+        'categories': {'model': 'tests.category', 'p_keys': []},
+    })
+    product_form = ProductForm(data={'name': "Shirt", 'active': True, 'tenant': 1}, instance=instance)
+    assert product_form.is_valid()
+    product_form.instance.dummy_field = "changed"
+    product_form.save()
+    assert Product.objects.get().dummy_field == "changed"
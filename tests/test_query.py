@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Q
+
+from .models import Category, Product
+from .test_retangled import ProductForm
+
+
+@pytest.fixture
+def products():
+    for name, tenant, color, size in [("Shirt", 1, "red", "m"), ("Socks", 2, "blue", "s"), ("Scarf", 2, "red", "l")]:
+        Product.objects.create(name=name, properties={
+            'active': True,
+            'extra': {
+                'variants': {'color': color, 'size': size},
+                'categories': {'model': 'tests.category', 'p_keys': [1, 2] if size == "l" else [1]},
+            },
+            'ownership': {'tenant': {'model': 'auth.user', 'pk': tenant}},
+        })
+    return Product.objects.entangled(ProductForm)
+
+
+@pytest.mark.django_db
+def test_filter(products):
+    assert {p.name for p in products.filter(color="red")} == {"Shirt", "Scarf"}
+    assert {p.name for p in products.exclude(color="red")} == {"Socks"}
+    assert {p.name for p in products.filter(color__in=["blue", "green"])} == {"Socks"}
+    assert {p.name for p in products.filter(Q(size="s") | Q(size="l"))} == {"Socks", "Scarf"}
+    mary = get_user_model().objects.get(username="Mary")
+    assert {p.name for p in products.filter(tenant=mary)} == {"Socks", "Scarf"}
+    assert {p.name for p in products.filter(tenant__in=[1])} == {"Shirt"}
+    assert products.get(color="red", tenant=mary).name == "Scarf"
+
+
+@pytest.mark.django_db
+def test_order_by_values(products):
+    assert [p.name for p in products.order_by('color', '-size')] == ["Socks", "Shirt", "Scarf"]
+    assert list(products.order_by('name').values('name', 'color')) == [
+        {'name': "Scarf", 'color': "red"},
+        {'name': "Shirt", 'color': "red"},
+        {'name': "Socks", 'color': "blue"},
+    ]
+    assert list(products.order_by(F('tenant').desc(), 'name').values_list('name', 'tenant')) == [
+        ("Scarf", 2), ("Socks", 2), ("Shirt", 1),
+    ]
+    annotated = products.values('color').annotate(count=Count('pk')).order_by('color')
+    assert [(a['color'], a['count']) for a in annotated] == [("blue", 1), ("red", 2)]
+    assert products.annotate(shade=F('color')).get(name="Socks").shade == "blue"
+
+
+@pytest.mark.django_db
+def test_untranslated(products):
+    assert Product.objects.filter(properties__extra__variants__color="red").count() == 2
+    assert products.filter(name="Shirt").count() == 1
+    assert pickle.loads(pickle.dumps(products.filter(color="red"))).count() == 2
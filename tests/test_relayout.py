@@ -0,0 +1,99 @@
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.db import NotSupportedError
+
+from entangled.expressions import JSONBExtractPath, JSONBMerge, JSONBRemovePath
+from entangled.utils import relayout_json_field
+from .models import Product
+
+
+@pytest.mark.django_db
+def test_relayout_json_field():
+    Product.objects.create(name="Shirt", properties={'color': "red", 'size': "m", 'weight': 3})
+    Product.objects.create(name="Socks", properties={'size': "s"})
+    Product.objects.create(name="Cap", properties={'style': {'color': "blue"}})
+    reports = []
+    count = relayout_json_field(
+        Product.objects.all(), 'properties',
+        {'color': 'color', 'size': 'size', 'weight': 'weight'},
+        {'color': 'style.color', 'size': 'variants.size', 'weight': 'weight'},
+        batch_size=2, progress=lambda *args: reports.append(args),
+    )
+    assert count == 2
+    assert list(Product.objects.order_by('pk').values_list('properties', flat=True)) == [
+        {'style': {'color': "red"}, 'variants': {'size': "m"}, 'weight': 3},
+        {'variants': {'size': "s"}},
+        {'style': {'color': "blue"}},
+    ]
+    pks = list(Product.objects.order_by('pk').values_list('pk', flat=True))
+    assert reports == [(2, 2, pks[1]), (3, 2, pks[2])]
+
+
+@pytest.mark.django_db
+def test_relayout_swap_and_resume():
+    first = Product.objects.create(name="Shirt", properties={'color': "red", 'size': "m"})
+    Product.objects.create(name="Socks", properties={'color': "blue", 'size': "s"})
+    count = relayout_json_field(
+        Product.objects.all(), 'properties', {'color': 'color', 'size': 'size'}, {'color': 'size', 'size': 'color'},
+        start_after=first.pk,
+    )
+    assert count == 1
+    assert list(Product.objects.order_by('pk').values_list('properties', flat=True)) == [
+        {'color': "red", 'size': "m"},
+        {'color': "s", 'size': "blue"},
+    ]
+
+
+@pytest.mark.django_db
+def test_relayout_overlapping_paths():
+    with pytest.raises(ValueError):
+        relayout_json_field(Product.objects.all(), 'properties', {'a': 'a', 'b': 'b'}, {'a': 'x', 'b': 'x.y'})
+    Product.objects.create(name="Shirt", properties={'color': "red", 'style': "casual"})
+    with pytest.raises(ValueError):
+        relayout_json_field(
+            Product.objects.all(), 'properties', {'color': 'color', 'style': 'style'},
+            {'color': 'style.color', 'style': 'style'},
+        )
+    assert Product.objects.get().properties == {'color': "red", 'style': "casual"}
+    with pytest.raises(NotSupportedError):
+        relayout_json_field(Product.objects.all(), 'properties', {'a': 'a'}, {'a': 'x'}, use_sql=True)
+
+
+class PostgresCompiler:
+    def compile(self, expression):
+        if hasattr(expression, 'as_postgresql'):
+            return expression.as_postgresql(self, None)
+        return '"properties"', []
+
+
+@pytest.mark.django_db
+def test_relayout_sql():
+    expression = JSONBMerge(
+        JSONBRemovePath('properties', ('color',)),
+        {('style', 'color'): JSONBExtractPath('properties', ('color',))},
+    )
+    sql, params = expression.as_postgresql(PostgresCompiler(), None)
+    assert sql == (
+        "(CASE WHEN jsonb_typeof((\"properties\" #- %s::text[])) = 'object' "
+        "THEN (\"properties\" #- %s::text[]) ELSE '{}'::jsonb END || jsonb_build_object("
+        "%s::text, (CASE WHEN jsonb_typeof(((\"properties\" #- %s::text[]) #> %s::text[])) = 'object' "
+        "THEN ((\"properties\" #- %s::text[]) #> %s::text[]) ELSE '{}'::jsonb END || "
+        "jsonb_build_object(%s::text, (\"properties\" #> %s::text[])))))"
+    )
+    assert params == [
+        ['color'], ['color'], 'style', ['color'], ['style'], ['color'], ['style'], 'color', ['color'],
+    ]
+
+
+@pytest.mark.django_db
+def test_relayoutentangled_command():
+    product = Product.objects.create(name="Shirt", properties={'color': "red"})
+    out = StringIO()
+    call_command('relayoutentangled', 'tests.Product', 'properties', move=['color=style.color'], stdout=out)
+    assert "Processed 1 objects, rewrote 1, last primary key {}.".format(product.pk) in out.getvalue()
+    assert "Rewrote 1 objects of tests.Product." in out.getvalue()
+    product.refresh_from_db()
+    assert product.properties == {'style': {'color': "red"}}
@@ -6,7 +6,7 @@ from django.forms import fields
 from django.forms.models import ModelChoiceField, ModelMultipleChoiceField
 from django.utils.html import strip_spaces_between_tags
 
-from entangled.forms import EntangledModelForm
+from entangled.forms import EntangledModelForm, EntangledFieldPlan
 from .models import Product, Category
 
 
@@ -112,3 +112,36 @@ def test_instance_form():
         features='lxml',
     )
     assert BeautifulSoup(strip_spaces_between_tags(product_form.as_ul()), features='lxml') == expected
+
+
+@pytest.mark.django_db
+def test_entangled_plan():
+    plan = {p.name: p for p in ProductForm._meta.entangled_plan}
+    assert list(plan.keys()) == ['tenant', 'active', 'color', 'size', 'categories']
+    assert plan['color'].json_field == 'properties'
+    assert plan['color'].path == ('extra', 'variants', 'color')
+    assert plan['color'].kind == EntangledFieldPlan.VALUE
+    assert plan['tenant'].kind == EntangledFieldPlan.OBJECT
+    assert plan['categories'].kind == EntangledFieldPlan.OBJECT_LIST
+    with pytest.raises(AttributeError):
+        plan['color'].path = ('color',)
+
+
+@pytest.mark.django_db
+def test_inherited_entangled_plan():
+    class WeightedProductForm(ProductForm):
+        weight = fields.IntegerField()
+
+        class Meta:
+            model = Product
+            untangled_fields = ['name']
+            entangled_fields = {'properties': ['color', 'weight']}
+            retangled_fields = {'color': 'variants.color', 'size': 'extra.variants.size'}
+
+    base_plan = {p.name: p for p in ProductForm._meta.entangled_plan}
+    plan = {p.name: p for p in WeightedProductForm._meta.entangled_plan}
+    assert WeightedProductForm._meta.untangled_fields == ['name']
+    assert list(plan.keys()) == ['tenant', 'active', 'size', 'categories', 'color', 'weight']
+    assert plan['size'] is base_plan['size']
+    assert plan['color'].path == ('variants', 'color')
+    assert plan['tenant'].path == ('tenant',)
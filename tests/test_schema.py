@@ -0,0 +1,55 @@
+import pytest
+
+from entangled.schema import EntangledValidator
+from .test_importers import LimitedProductForm
+from .test_retangled import ProductForm
+
+
+@pytest.mark.django_db
+def test_validate():
+    validator = EntangledValidator(ProductForm)
+    data = {'name': "Colibri", 'tenant': 2, 'active': True, 'color': "red", 'size': "m", 'categories': [1, 2]}
+    cleaned_data, errors = validator.validate(data)
+    assert errors == {}
+    assert cleaned_data == {
+        'name': "Colibri",
+        'properties': {
+            'ownership': {'tenant': {'model': 'auth.user', 'pk': 2}},
+            'active': True,
+            'extra': {
+                'variants': {'color': "red", 'size': "m"},
+                'categories': {'model': 'tests.category', 'p_keys': [1, 2]},
+            },
+        },
+    }
+    product_form = ProductForm(data=data)
+    assert product_form.is_valid()
+    assert product_form.cleaned_data == cleaned_data
+
+
+@pytest.mark.django_db
+def test_validate_many(django_assert_num_queries):
+    validator = EntangledValidator(ProductForm)
+    payloads = [
+        {'name': "Colibri", 'tenant': 1, 'active': True, 'color': "red", 'size': "s", 'categories': [1]},
+        {'name': "Hummingbird", 'tenant': 2, 'active': True, 'color': "blue", 'size': "l"},
+        {'name': "Sparrow", 'tenant': 3, 'active': True, 'color': "grey", 'size': "xl"},
+    ]
+    with django_assert_num_queries(2):
+        results = validator.validate_many(payloads)
+    assert results[0][0]['properties']['ownership'] == {'tenant': {'model': 'auth.user', 'pk': 1}}
+    assert results[1][0]['properties']['extra']['categories'] == {'model': 'tests.category', 'p_keys': []}
+    assert results[2][0] is None
+    assert sorted(results[2][1].keys()) == ['size', 'tenant']
+    assert results[2][1]['size'][0].code == 'invalid_choice'
+
+
+@pytest.mark.django_db
+def test_validate_limit_choices_to():
+    validator = EntangledValidator(LimitedProductForm)
+    payloads = [{'name': "Broom", 'active': True, 'tenant': 1}, {'name': "Brush", 'active': True, 'tenant': 2}]
+    assert LimitedProductForm(data=payloads[1]).is_valid() is False
+    for results in ([validator.validate(data) for data in payloads], validator.validate_many(payloads)):
+        assert results[0][1] == {}
+        assert results[1][0] is None
+        assert results[1][1]['tenant'][0].code == 'invalid_choice'
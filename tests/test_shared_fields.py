@@ -0,0 +1,56 @@
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.forms import fields, modelformset_factory
+from django.forms.models import ModelChoiceField
+
+from entangled.formsets import BaseEntangledModelFormSet
+from entangled.forms import EntangledModelForm, SharedFields
+from .models import Product
+
+
+class ProductForm(EntangledModelForm):
+    name = fields.CharField()
+    color = fields.CharField()
+    tenant = ModelChoiceField(queryset=get_user_model().objects.all())
+
+    class Meta:
+        model = Product
+        untangled_fields = ['name']
+        entangled_fields = {'properties': ['color', 'tenant']}
+        entangled_shared_fields = True
+
+
+@pytest.mark.django_db
+def test_shared_fields():
+    assert isinstance(ProductForm.base_fields, SharedFields)
+    first, second = ProductForm(), ProductForm()
+    assert first.fields['color'] is second.fields['color'] is ProductForm.base_fields['color']
+    assert first.fields['tenant'] is not ProductForm.base_fields['tenant']
+    assert first.fields['tenant'].queryset is not second.fields['tenant'].queryset
+
+    color_field = first.get_writable_field('color')
+    assert color_field is not ProductForm.base_fields['color']
+    assert first.get_writable_field('color') is color_field
+    color_field.label = "Colour"
+    assert first['color'].label == "Colour"
+    assert second['color'].label == "Color"
+
+
+@pytest.mark.django_db
+def test_shared_fields_formset():
+    for color in ("red", "green"):
+        Product.objects.create(name="Shirt", properties={'color': color, 'tenant': {'model': 'auth.user', 'pk': 1}})
+    ProductFormSet = modelformset_factory(Product, form=ProductForm, formset=BaseEntangledModelFormSet, extra=0)
+    formset = ProductFormSet(queryset=Product.objects.order_by('pk'))
+    assert [form.initial['color'] for form in formset.forms] == ["red", "green"]
+    assert formset.forms[0].fields['color'] is formset.forms[1].fields['color']
+    data = {
+        'form-TOTAL_FORMS': '2', 'form-INITIAL_FORMS': '2',
+        'form-0-id': formset.forms[0].instance.pk, 'form-0-name': "Shirt", 'form-0-color': "red", 'form-0-tenant': 1,
+        'form-1-id': formset.forms[1].instance.pk, 'form-1-name': "Shirt", 'form-1-color': "blue", 'form-1-tenant': 2,
+    }
+    formset = ProductFormSet(data=data, queryset=Product.objects.order_by('pk'))
+    assert formset.is_valid(), formset.errors
+    formset.save()
+    assert [product.properties['color'] for product in Product.objects.order_by('pk')] == ["red", "blue"]